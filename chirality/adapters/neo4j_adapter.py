@@ -5,19 +5,43 @@ Provides write-through capabilities to Neo4j graph database.
 """
 
 import os
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import copy
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 
 try:
     from neo4j import GraphDatabase
 except ImportError:
     GraphDatabase = None
 
+from ..core.provenance import now_iso
+
+if TYPE_CHECKING:
+    from ..core.types import Matrix
+
+
+# Cells written per UNWIND query; bounds transaction state on large matrices
+CELL_BATCH_SIZE = 1000
+
+_SAVE_CELLS = """
+UNWIND $cells AS c
+MATCH (m:Matrix {id: $matrix_id})
+MERGE (x:Cell {id: c.id})
+SET x.row = c.row,
+    x.col = c.col,
+    x.value = c.value,
+    x.updated_at = $timestamp
+MERGE (m)-[:HAS_CELL {row: c.row, col: c.col}]->(x)
+"""
+
+# Matrices kept by load_matrix() per adapter; oldest entries are dropped first
+MATRIX_CACHE_SIZE = 128
+
 
 class Neo4jAdapter:
     """Neo4j adapter for matrix/cell persistence."""
     
-    def __init__(self, uri: str, user: str, password: str):
+    def __init__(self, uri: str, user: str, password: str, connection_timeout: Optional[float] = None,
+                 cache_matrices: bool = False):
         """
         Initialize Neo4j connection.
         
@@ -25,11 +49,16 @@ class Neo4jAdapter:
             uri: Neo4j URI (e.g., bolt://localhost:7687)
             user: Username
             password: Password
+            connection_timeout: Seconds to wait for a connection (driver default if None)
+            cache_matrices: Cache load_matrix() results for the duration of a
+                pipeline run (see load_matrix())
         """
         if GraphDatabase is None:
             raise ImportError("neo4j package required. Install with: pip install neo4j")
         
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        driver_kwargs = {} if connection_timeout is None else {"connection_timeout": connection_timeout}
+        self.driver = GraphDatabase.driver(uri, auth=(user, password), **driver_kwargs)
+        self._matrix_cache: Optional[Dict[str, "Matrix"]] = {} if cache_matrices else None
         self._ensure_schema()
     
     def _ensure_schema(self):
@@ -70,84 +99,67 @@ class Neo4jAdapter:
             matrix: Matrix to save
             thread_id: Optional thread ID for context
         """
-        from ..core.types import Matrix
+        # One timestamp for the whole save: thread, matrix and all cells
+        timestamp = now_iso()
         
+        # Thread, matrix and all cells are written in one transaction
         with self.driver.session() as session:
-            # Create or merge thread
-            if thread_id:
-                session.run(
-                    "MERGE (t:Thread {id: $thread_id}) "
-                    "SET t.updated_at = $timestamp",
-                    thread_id=thread_id,
-                    timestamp=datetime.utcnow().isoformat()
-                )
-            
-            # Create matrix node
-            session.run("""
-                MERGE (m:Matrix {id: $id})
-                SET m.name = $name,
-                    m.station = $station,
-                    m.rows = $rows,
-                    m.cols = $cols,
-                    m.hash = $hash,
-                    m.metadata = $metadata,
-                    m.updated_at = $timestamp
-                """,
-                id=matrix.id,
-                name=matrix.name,
-                station=matrix.station,
-                rows=matrix.shape[0],
-                cols=matrix.shape[1],
-                hash=matrix.hash,
-                metadata=str(matrix.metadata),
-                timestamp=datetime.utcnow().isoformat()
-            )
-            
-            # Link to thread if provided
-            if thread_id:
-                session.run("""
-                    MATCH (t:Thread {id: $thread_id})
-                    MATCH (m:Matrix {id: $matrix_id})
-                    MERGE (t)-[:HAS_MATRIX]->(m)
-                    """,
-                    thread_id=thread_id,
-                    matrix_id=matrix.id
-                )
-            
-            # Save cells
-            for cell in matrix.cells:
-                self._save_cell(session, cell, matrix.id)
+            session.execute_write(self._write_matrix, matrix, thread_id, timestamp)
+        if self._matrix_cache is not None:
+            self._matrix_cache.pop(matrix.id, None)
     
-    def _save_cell(self, session, cell: "Cell", matrix_id: str) -> None:
-        """Save individual cell."""
-        from ..core.types import Cell
+    def _write_matrix(self, tx, matrix: "Matrix", thread_id: Optional[str], timestamp: str) -> None:
+        """Transaction function for save_matrix(); may be retried by the driver."""
+        # Create or merge thread
+        if thread_id:
+            tx.run(
+                "MERGE (t:Thread {id: $thread_id}) "
+                "SET t.updated_at = $timestamp",
+                thread_id=thread_id,
+                timestamp=timestamp
+            ).consume()
         
-        # Create cell node
-        session.run("""
-            MERGE (c:Cell {id: $id})
-            SET c.row = $row,
-                c.col = $col,
-                c.value = $value,
-                c.updated_at = $timestamp
+        # Create matrix node
+        tx.run("""
+            MERGE (m:Matrix {id: $id})
+            SET m.name = $name,
+                m.station = $station,
+                m.rows = $rows,
+                m.cols = $cols,
+                m.hash = $hash,
+                m.metadata = $metadata,
+                m.updated_at = $timestamp
             """,
-            id=cell.id,
-            row=cell.row,
-            col=cell.col,
-            value=cell.value,
-            timestamp=datetime.utcnow().isoformat()
-        )
+            id=matrix.id,
+            name=matrix.name,
+            station=matrix.station,
+            rows=matrix.shape[0],
+            cols=matrix.shape[1],
+            hash=matrix.hash,
+            metadata=str(matrix.metadata),
+            timestamp=timestamp
+        ).consume()
         
-        # Link to matrix
-        session.run("""
-            MATCH (m:Matrix {id: $matrix_id})
-            MATCH (c:Cell {id: $cell_id})
-            MERGE (m)-[:HAS_CELL {row: $row, col: $col}]->(c)
-            """,
-            matrix_id=matrix_id,
-            cell_id=cell.id,
-            row=cell.row,
-            col=cell.col
-        )
+        # Link to thread if provided
+        if thread_id:
+            tx.run("""
+                MATCH (t:Thread {id: $thread_id})
+                MATCH (m:Matrix {id: $matrix_id})
+                MERGE (t)-[:HAS_MATRIX]->(m)
+                """,
+                thread_id=thread_id,
+                matrix_id=matrix.id
+            ).consume()
+        
+        # Save cells: one UNWIND query per batch instead of two per cell
+        cell_rows = [{"id": c.id, "row": c.row, "col": c.col, "value": c.value} for c in matrix.cells]
+        for start in range(0, len(cell_rows), CELL_BATCH_SIZE):
+            tx.run(
+                _SAVE_CELLS,
+                cells=cell_rows[start:start + CELL_BATCH_SIZE],
+                matrix_id=matrix.id,
+                timestamp=timestamp
+            ).consume()
     
     def load_matrix(self, matrix_id: str) -> Optional["Matrix"]:
         """
@@ -158,7 +170,32 @@ class Neo4jAdapter:
         
         Returns:
             Matrix instance or None if not found
+        
+        With cache_matrices=True, a run that reads the same matrix at several
+        stations queries Neo4j once; every call returns its own copy. The
+        cache only sees this adapter's save_matrix() calls, so call
+        clear_cache() at the start of each pipeline run.
         """
+        cache = self._matrix_cache
+        if cache is None:
+            return self._fetch_matrix(matrix_id)
+        cached = cache.get(matrix_id)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        matrix = self._fetch_matrix(matrix_id)
+        if matrix is not None:
+            if len(cache) >= MATRIX_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[matrix_id] = copy.deepcopy(matrix)
+        return matrix
+    
+    def clear_cache(self) -> None:
+        """Drop matrices cached by load_matrix(); call at the start of a pipeline run."""
+        if self._matrix_cache is not None:
+            self._matrix_cache.clear()
+    
+    def _fetch_matrix(self, matrix_id: str) -> Optional["Matrix"]:
+        """Query a matrix and its cells; uncached backend for load_matrix()."""
         from ..core.types import Matrix, MatrixType, Cell, Modality
         import ast
         
@@ -215,18 +252,20 @@ class Neo4jAdapter:
             target_id: Target matrix ID
             operation: Operation that created the relationship
         """
+        timestamp = now_iso()
         with self.driver.session() as session:
-            for source_id in source_ids:
-                session.run("""
-                    MATCH (s:Matrix {id: $source_id})
-                    MATCH (t:Matrix {id: $target_id})
-                    MERGE (s)-[:DERIVES {operation: $operation, timestamp: $timestamp}]->(t)
-                    """,
-                    source_id=source_id,
-                    target_id=target_id,
-                    operation=operation,
-                    timestamp=datetime.utcnow().isoformat()
-                )
+            # All sources in one query rather than one round-trip each
+            session.run("""
+                UNWIND $source_ids AS source_id
+                MATCH (s:Matrix {id: source_id})
+                MATCH (t:Matrix {id: $target_id})
+                MERGE (s)-[:DERIVES {operation: $operation, timestamp: $timestamp}]->(t)
+                """,
+                source_ids=list(source_ids),
+                target_id=target_id,
+                operation=operation,
+                timestamp=timestamp
+            ).consume()
     
     def query_matrices(self, matrix_type: Optional[str] = None, thread_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
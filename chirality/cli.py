@@ -24,12 +24,8 @@ from .core.types import Matrix
 from .core.ops import OpenAIResolver, EchoResolver
 from .core.stations import S1Runner, S2Runner, S3Runner
 from .core.serialize import load_matrix, save_matrix, export_pipeline_results, format_matrix_summary
-from .adapters.neo4j_adapter import Neo4jAdapter
-
-try:
-    from .exporters.neo4j_cf14_exporter import CF14Neo4jExporter
-except ImportError:
-    CF14Neo4jExporter = None  # optional dependency
+# Neo4j adapter/exporter are imported where used: loading the neo4j driver
+# is by far the largest import cost, and most commands never touch it
 
 
 def main():
@@ -55,6 +51,8 @@ def main():
     run_parser.add_argument("--neo4j-uri", default=os.getenv("NEO4J_URI", "bolt://localhost:7687"), help="Neo4j URI")
     run_parser.add_argument("--neo4j-user", default=os.getenv("NEO4J_USER", "neo4j"), help="Neo4j username")
     run_parser.add_argument("--neo4j-password", default=os.getenv("NEO4J_PASSWORD", "password"), help="Neo4j password")
+    run_parser.add_argument("--neo4j-timeout", type=float, default=None,
+                           help="Neo4j connection timeout in seconds (default: $NEO4J_TIMEOUT or 5)")
     
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate matrix files")
@@ -79,6 +77,18 @@ def main():
         sys.exit(1)
 
 
+def _neo4j_timeout(args) -> float:
+    """Connection timeout from --neo4j-timeout, else $NEO4J_TIMEOUT (default 5s)."""
+    if args.neo4j_timeout is not None:
+        return args.neo4j_timeout
+    # Parsed only when a driver is created, so a bad value cannot break other commands
+    raw = os.getenv("NEO4J_TIMEOUT", "5")
+    try:
+        return float(raw)
+    except ValueError:
+        raise ValueError(f"NEO4J_TIMEOUT must be a number of seconds, got {raw!r}") from None
+
+
 def run_pipeline(args):
     """Run the CF14 pipeline."""
     print(f"Chirality Framework CF14 Pipeline")
@@ -148,11 +158,18 @@ def run_pipeline(args):
     for name, path in paths.items():
         print(f"  {name}: {path}")
     
+    # CI/offline switch: skip Neo4j writes without touching the network
+    if (args.write_neo4j or args.write_cf14_neo4j) and os.getenv("CF14_SKIP_NEO4J") == "1":
+        print("\nNeo4j writes skipped (CF14_SKIP_NEO4J=1)")
+        args.write_neo4j = args.write_cf14_neo4j = False
+    
     # Write to Neo4j if requested
     if args.write_neo4j:
         print(f"\nWriting to Neo4j (legacy adapter)...")
         try:
-            neo4j = Neo4jAdapter(args.neo4j_uri, args.neo4j_user, args.neo4j_password)
+            from .adapters.neo4j_adapter import Neo4jAdapter
+            neo4j = Neo4jAdapter(args.neo4j_uri, args.neo4j_user, args.neo4j_password,
+                                 connection_timeout=_neo4j_timeout(args))
             
             for name, matrix in s3_results.items():
                 neo4j.save_matrix(matrix, args.thread)
@@ -173,6 +190,10 @@ def run_pipeline(args):
     if args.write_cf14_neo4j:
         print(f"\nWriting CF14 matrices to Neo4j...")
         try:
+            try:
+                from .exporters.neo4j_cf14_exporter import CF14Neo4jExporter
+            except ImportError:
+                CF14Neo4jExporter = None  # optional dependency
             if CF14Neo4jExporter is None:
                 print("  Error: CF14Neo4jExporter not available. Install neo4j dependency.")
             else:
@@ -195,6 +216,7 @@ def run_pipeline(args):
                     uri=args.neo4j_uri,
                     user=args.neo4j_user,
                     password=args.neo4j_password,
+                    connection_timeout=_neo4j_timeout(args),
                 )
                 exporter.export(matrices_dict, args.thread)
                 exporter.close()
@@ -229,7 +251,7 @@ def validate_matrices(args):
                 for error in errors:
                     print(f"    - {error}")
             else:
-                print(f"  ✓ Valid matrix: {matrix.type.value} {matrix.dimensions}")
+                print(f"  ✓ Valid matrix: {matrix.name} {matrix.dimensions}")
         except Exception as e:
             print(f"  ✗ Failed to load: {e}")
 
@@ -4,6 +4,7 @@ Core CF14 framework modules.
 
 from .types import Cell, Matrix, Tensor, Station, Operation
 from .ops import EchoResolver, OpenAIResolver, op_multiply, op_interpret, op_elementwise, op_add, op_cross
+from .ops import AsyncOpenAIResolver, run_ops_concurrently
 from .serialize import load_matrix, save_matrix
 from .validate import CF14ValidationError
 from .ids import generate_cell_id, generate_matrix_id, generate_operation_id
@@ -14,6 +15,7 @@ __all__ = [
     # Operations
     "EchoResolver", "OpenAIResolver", 
     "op_multiply", "op_interpret", "op_elementwise", "op_add", "op_cross",
+    "AsyncOpenAIResolver", "run_ops_concurrently",
     # Serialization
     "load_matrix", "save_matrix",
     # Validation
@@ -0,0 +1,157 @@
+"""
+Caches for resolver output.
+
+- ResolveCache: persistent exact-match store. Grids are JSON files named by a
+  deterministic hash of the prompt, context and inputs, so replayed workflows
+  skip the LLM round-trip entirely.
+- SemanticCache: optional in-memory tier that reuses a grid when a new prompt's
+  embedding is near-identical to a previously resolved one.
+"""
+
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from .types import Matrix
+from .provenance import prompt_hash
+from .serialize import dumps_json, loads_json
+
+
+DEFAULT_CACHE_DIR = "~/.cache/chirality"
+
+
+def resolve_key(op: str, inputs: List[Matrix], system_prompt: str, user_prompt: str,
+                context: Dict[str, Any], model: str = "") -> str:
+    """
+    Generate cache key for a resolve() call.
+
+    Args:
+        op: Operation kind
+        inputs: Input matrices (their content hashes are part of the key)
+        system_prompt: System prompt
+        user_prompt: User prompt
+        context: Resolver context
+        model: Model identifier
+
+    Returns:
+        Deterministic hex key
+    """
+    basis = {
+        "op": op,
+        "model": model,
+        "inputs": [m.hash for m in inputs],
+        "context": context,
+    }
+    return prompt_hash(system_prompt, user_prompt, basis)
+
+
+class ResolveCache:
+    """On-disk store of resolver grids keyed by resolve_key()."""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            root: Cache directory (default: $CHIRALITY_CACHE_DIR or ~/.cache/chirality)
+        """
+        root = root or os.getenv("CHIRALITY_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.root = Path(root).expanduser()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[List[str]]]:
+        """Return cached grid or None on miss/corruption."""
+        try:
+            with open(self._path(key), "rb") as f:
+                grid = loads_json(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(grid, list) or not all(isinstance(r, list) for r in grid):
+            return None
+        return grid
+
+    def put(self, key: str, grid: List[List[str]]) -> None:
+        """Persist grid atomically (write temp file, then rename)."""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        except OSError:
+            # Cache is best-effort; never fail a resolution over it
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps_json(grid, indent=None))
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache over prompt embeddings.
+
+    Entries are bucketed (e.g. by op, model and target shape) so a near match
+    can never return a grid of the wrong kind or shape. Lookup is a linear
+    cosine scan, which is adequate for the per-process entry counts involved.
+    """
+
+    def __init__(self, embed: Callable[[str], List[float]], threshold: float = 0.95,
+                 max_entries: int = 1024):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embed: Function returning an embedding vector for a text
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Per-bucket cap; oldest entries are dropped first
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, List[Tuple[List[float], List[List[str]]]]] = {}
+
+    def lookup(self, bucket: Hashable, text: str) -> Tuple[Optional[List[List[str]]], Optional[Tuple[Hashable, List[float]]]]:
+        """
+        Find the closest cached grid for `text` within `bucket`.
+
+        Returns:
+            (grid or None, probe) where probe is passed to add() after a miss;
+            probe is None if the text could not be embedded. A hit is a copy
+            of the cached grid, so callers may modify it.
+        """
+        try:
+            vec = _unit(self.embed(text))
+        except Exception:
+            # Embedding is an optimization; a failure is just a miss
+            return None, None
+        best, best_sim = None, self.threshold
+        for other, grid in self._entries.get(bucket, ()):
+            sim = sum(a * b for a, b in zip(vec, other))
+            if sim >= best_sim:
+                best, best_sim = grid, sim
+        if best is not None:
+            best = [list(row) for row in best]
+        return best, (bucket, vec)
+
+    def add(self, probe: Tuple[Hashable, List[float]], grid: List[List[str]]) -> None:
+        """Store a copy of grid under the embedding computed by lookup()."""
+        bucket, vec = probe
+        entries = self._entries.setdefault(bucket, [])
+        entries.append((vec, [list(row) for row in grid]))
+        if len(entries) > self.max_entries:
+            del entries[0]
+
+
+def _unit(vec: List[float]) -> List[float]:
+    """Scale vector to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(x * x for x in vec))
+    if norm == 0.0:
+        raise ValueError("zero-length embedding")
+    return [x / norm for x in vec]
@@ -8,10 +8,12 @@ on individual matrix cells using structured prompts and JSON responses.
 import os
 import json
 import time
+import random
 import hashlib
 import unicodedata
-import re
-from typing import Dict, Any, List, Optional, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Literal, Tuple, Mapping
 from datetime import datetime
 
 try:
@@ -20,6 +22,87 @@ except Exception:
     OpenAI = None  # Defer hard failure until actually instantiated
 
 from .types import Cell, Matrix
+from .serialize import loads_json
+
+
+# Temperature per cell operation
+_CELL_TEMPERATURES: Mapping[str, float] = MappingProxyType({
+    "multiply": 0.7,  # Creative intersection
+    "add": 0.5,       # Tighter integration
+    "interpret": 0.5  # Clear explanation
+})
+
+
+# One client per API key. Each OpenAI() owns an httpx connection pool, so
+# sharing it lets resolvers and per-op CellResolvers reuse warm TCP/TLS
+# connections instead of handshaking again.
+_CLIENT_CACHE: Dict[str, Any] = {}
+
+
+# Successful cell responses keyed by (model, temperature, operation, user
+# prompt or batch item), shared across CellResolver instances. The same
+# term pair at the same position recurs across runs in a process; the
+# oldest entries are evicted first. CellResolver(memoize=False) bypasses it
+# so sampled cells are drawn fresh on every call.
+_RESULT_CACHE_MAX = 4096
+_RESULT_CACHE: Dict[Tuple[str, float, str, str], Dict[str, Any]] = {}
+
+
+# Items per batched request. Each item is budgeted 200 output tokens, so a
+# request stays well under the completion cap however large the matrix is.
+BATCH_MAX_ITEMS = 16
+
+
+# Keys every cell result must carry; list-valued ones default to []
+_RESULT_KEYS = ("text", "terms_used", "warnings")
+_LIST_RESULT_KEYS = frozenset(("terms_used", "warnings"))
+
+
+def _fill_result_keys(result: Dict[str, Any]) -> None:
+    """Add any missing required keys to a parsed cell result, in place."""
+    for key in _RESULT_KEYS:
+        if key not in result:
+            result[key] = [] if key in _LIST_RESULT_KEYS else ""
+
+
+def _store_result(key: Tuple[str, float, str, str], result: Dict[str, Any]) -> None:
+    """Cache a copy of a successful cell result, evicting the oldest entry when full."""
+    if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+        # Dicts keep insertion order; pop() tolerates another thread evicting first
+        _RESULT_CACHE.pop(next(iter(_RESULT_CACHE), None), None)
+    _RESULT_CACHE[key] = _copy_result(result)
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cell result so callers cannot mutate the cached entry's lists."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
+def shared_client(api_key: str) -> Any:
+    """Return the process-wide OpenAI client for `api_key`, creating it once."""
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        if OpenAI is None:
+            raise ImportError("OpenAI package required. Install with: pip install openai")
+        client = _CLIENT_CACHE.setdefault(api_key, OpenAI(api_key=api_key))
+    return client
+
+
+_VALLEY_STATIONS = ("Problem Statement", "Requirements", "Objectives", "Solution Objectives")
+
+
+@lru_cache(maxsize=64)
+def _valley_summary(station: str) -> str:
+    """Valley map with `station` bracketed; built once per station, not per cell prompt."""
+    stations = list(_VALLEY_STATIONS)
+    
+    # Find and bracket current station
+    for i, s in enumerate(stations):
+        if station.lower() in s.lower() or s.lower() in station.lower():
+            stations[i] = f"[{s}]"
+            break
+    
+    return f"Semantic Valley: {' → '.join(stations)}"
 
 
 def normalize_text(s: str) -> str:
@@ -27,19 +110,49 @@ def normalize_text(s: str) -> str:
     if s is None:
         return ""
     s = unicodedata.normalize("NFKC", str(s))
-    s = re.sub(r"\s+", " ", s).strip()
+    s = " ".join(s.split())
     return s
 
 
 def escape_for_prompt(s: str) -> str:
     """Escape string for safe embedding in prompts."""
+    if isinstance(s, str):
+        return _escape_str(s)
     return json.dumps(normalize_text(s), ensure_ascii=False)[1:-1]
 
 
+@lru_cache(maxsize=4096)
+def _escape_str(s: str) -> str:
+    # Memoized: each prompt escapes its terms twice (body and terms_used
+    # echo), and the same terms recur across every cell of a matrix
+    return json.dumps(normalize_text(s), ensure_ascii=False)[1:-1]
+
+
+# Per-operation role, task and output contract, shared by the single-cell
+# prompts and their batched variants so both resolve under one instruction set.
+# Batch items echo these keys' values in "terms_used", as single prompts do.
+_MULTIPLY_ROLE = "expert in conceptual synthesis"
+_MULTIPLY_TASK = """Task (semantic multiplication, ×):
+Fuse these meanings at their intersection. Preserve both identities; remain within the station's scope."""
+_MULTIPLY_CONTRACT = '"terms_used" must include EXACT normalized echoes of both inputs'
+_MULTIPLY_ECHO = ("a", "b")
+
+_ADD_ROLE = "expert integrator"
+_ADD_TASK = """Task (semantic addition, +):
+Integrate the following product sentences into one coherent statement WITHOUT flattening distinctions"""
+_ADD_CONTRACT = 'If products are empty, add "warnings": ["missing_input:products"]'
+_ADD_ECHO: Tuple[str, ...] = ()
+
+_BATCH_PROMPTS: Mapping[str, Tuple[str, str, str, Tuple[str, ...]]] = MappingProxyType({
+    "multiply": (_MULTIPLY_ROLE, _MULTIPLY_TASK, _MULTIPLY_CONTRACT, _MULTIPLY_ECHO),
+    "add": (_ADD_ROLE, _ADD_TASK, _ADD_CONTRACT, _ADD_ECHO),
+})
+
+
 class CellResolver:
     """Handles semantic operations on individual matrix cells."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o", memoize: bool = True):
         if OpenAI is None:
             raise ImportError("OpenAI package required. Install with: pip install openai")
 
@@ -47,15 +160,13 @@ class CellResolver:
         if not api_key:
             raise ValueError("OpenAI API key required")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = shared_client(api_key)
         self.model = model
+        # Reuse results from the process-wide _RESULT_CACHE; off = resample every cell
+        self.memoize = memoize
         
-        # Temperature settings for different operations
-        self.temperatures = {
-            "multiply": 0.7,  # Creative intersection
-            "add": 0.5,       # Tighter integration
-            "interpret": 0.5  # Clear explanation
-        }
+        # Temperature settings for different operations (shared, read-only)
+        self.temperatures: Mapping[str, float] = _CELL_TEMPERATURES
     
     def _get_system_prompt(self) -> str:
         """Get the standard CF14 system prompt."""
@@ -88,15 +199,7 @@ Output contract (STRICT):
 
     def _generate_valley_summary(self, station: str) -> str:
         """Generate valley summary with current station highlighted."""
-        stations = ["Problem Statement", "Requirements", "Objectives", "Solution Objectives"]
-        
-        # Find and bracket current station
-        for i, s in enumerate(stations):
-            if station.lower() in s.lower() or s.lower() in station.lower():
-                stations[i] = f"[{s}]"
-                break
-        
-        return f"Semantic Valley: {' → '.join(stations)}"
+        return _valley_summary(station)
 
     def multiply_terms(self, term_a: str, term_b: str, station: str, 
                       row_label: str = "", col_label: str = "") -> Dict[str, Any]:
@@ -115,7 +218,7 @@ Output contract (STRICT):
         """
         valley_summary = self._generate_valley_summary(station)
         
-        user_prompt = f"""Role: expert in conceptual synthesis within station "{escape_for_prompt(station)}" of the semantic valley.
+        user_prompt = f"""Role: {_MULTIPLY_ROLE} within station "{escape_for_prompt(station)}" of the semantic valley.
 
 Valley map:
 {valley_summary}
@@ -124,12 +227,11 @@ Position:
 - Row axis: "{escape_for_prompt(row_label)}"
 - Column axis: "{escape_for_prompt(col_label)}"
 
-Task (semantic multiplication, ×):
-Fuse these meanings at their intersection. Preserve both identities; remain within the station's scope.
+{_MULTIPLY_TASK}
 - "{escape_for_prompt(term_a)}"
 - "{escape_for_prompt(term_b)}"
 
-Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized echoes of both inputs:
+Output JSON ONLY (no extra text). {_MULTIPLY_CONTRACT}:
 {{"text": "", "terms_used": ["{escape_for_prompt(term_a)}","{escape_for_prompt(term_b)}"], "warnings": []}}"""
 
         return self._call_openai("multiply", user_prompt)
@@ -150,9 +252,9 @@ Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized ech
         """
         valley_summary = self._generate_valley_summary(station)
         
-        product_lines = "\n".join(f'- "{escape_for_prompt(p)}"' for p in (products or []))
+        product_lines = "\n".join([f'- "{escape_for_prompt(p)}"' for p in (products or [])])
         
-        user_prompt = f"""Role: expert integrator within station "{escape_for_prompt(station)}" of the semantic valley.
+        user_prompt = f"""Role: {_ADD_ROLE} within station "{escape_for_prompt(station)}" of the semantic valley.
 
 Valley map:
 {valley_summary}
@@ -161,11 +263,10 @@ Position:
 - Row axis: "{escape_for_prompt(row_label)}"
 - Column axis: "{escape_for_prompt(col_label)}"
 
-Task (semantic addition, +):
-Integrate the following product sentences into one coherent statement WITHOUT flattening distinctions:
+{_ADD_TASK}:
 {product_lines if product_lines else "- (no products provided)"}
 
-Output JSON ONLY (no extra text). If products are empty, add "warnings": ["missing_input:products"]:
+Output JSON ONLY (no extra text). {_ADD_CONTRACT}:
 {{"text": "", "terms_used": [], "warnings": []}}"""
 
         return self._call_openai("add", user_prompt)
@@ -206,10 +307,159 @@ Output JSON ONLY (no extra text):
 
         return self._call_openai("interpret", user_prompt)
 
+    def multiply_batch(self, pairs: List[Tuple[str, str, str, str]], station: str) -> List[Dict[str, Any]]:
+        """
+        Perform semantic multiplication on many term pairs in one call.
+        
+        Args:
+            pairs: (term_a, term_b, row_label, col_label) tuples
+            station: Current semantic valley station
+            
+        Returns:
+            One dict per pair (same order) with keys: text, terms_used, warnings
+        """
+        items = [
+            {"a": normalize_text(a), "b": normalize_text(b),
+             "row": normalize_text(row), "col": normalize_text(col)}
+            for a, b, row, col in pairs
+        ]
+        return self._call_openai_batch("multiply", station, items)
+
+    def add_batch(self, groups: List[Tuple[List[str], str, str]], station: str) -> List[Dict[str, Any]]:
+        """
+        Perform semantic addition for many cells in one call.
+        
+        Args:
+            groups: (products, row_label, col_label) tuples
+            station: Current semantic valley station
+            
+        Returns:
+            One dict per group (same order) with keys: text, terms_used, warnings
+        """
+        items = [
+            {"products": [normalize_text(p) for p in (products or [])],
+             "row": normalize_text(row), "col": normalize_text(col)}
+            for products, row, col in groups
+        ]
+        return self._call_openai_batch("add", station, items)
+
+    def _call_openai_batch(self, operation: str, station: str,
+                           items: List[Dict[str, Any]], max_retries: int = 3) -> List[Dict[str, Any]]:
+        """Resolve several cell operations with one JSON-mode call; results keep input order."""
+        if not items:
+            return []
+        
+        if not self.memoize:
+            # Every item is sampled independently: nothing is read, stored or deduplicated
+            out: List[Dict[str, Any]] = []
+            for start in range(0, len(items), BATCH_MAX_ITEMS):
+                out.extend(self._request_batch(operation, station, items[start:start + BATCH_MAX_ITEMS], max_retries))
+            return out
+        
+        # Items already resolved in this process (or repeated within the batch)
+        # are not sent again; only distinct uncached items reach the API
+        temperature = self.temperatures.get(operation, 0.5)
+        keys = [
+            (self.model, temperature, f"batch:{operation}:{station}",
+             json.dumps(item, sort_keys=True, ensure_ascii=False))
+            for item in items
+        ]
+        results: Dict[Tuple[str, float, str, str], Dict[str, Any]] = {}
+        for key in keys:
+            if key not in results:
+                # Single read: another thread's _store_result() may evict the entry
+                hit = _RESULT_CACHE.get(key)
+                if hit is not None:
+                    results[key] = hit
+        pending = list(dict.fromkeys(key for key in keys if key not in results))
+        # Fresh results are handed out as-is on first use (the cache holds its
+        # own copy); only cache hits and repeated items need a copy
+        owned: Dict[Tuple[str, float, str, str], Dict[str, Any]] = {}
+        if pending:
+            first: Dict[Tuple[str, float, str, str], int] = {}
+            for n, key in enumerate(keys):
+                first.setdefault(key, n)
+            # Fixed-size requests keep each response within the model's output cap
+            for start in range(0, len(pending), BATCH_MAX_ITEMS):
+                chunk = pending[start:start + BATCH_MAX_ITEMS]
+                fresh = self._request_batch(operation, station, [items[first[key]] for key in chunk], max_retries)
+                for key, result in zip(chunk, fresh):
+                    _store_result(key, result)
+                    results[key] = owned[key] = result
+        out = []
+        for key in keys:
+            result = owned.pop(key, None)
+            out.append(result if result is not None else _copy_result(results[key]))
+        return out
+
+    def _request_batch(self, operation: str, station: str,
+                       items: List[Dict[str, Any]], max_retries: int) -> List[Dict[str, Any]]:
+        """Send one JSON-mode batch request for `items` (at most BATCH_MAX_ITEMS)."""
+        role, task, contract, echo = _BATCH_PROMPTS[operation]
+        # Same per-item output template the single-cell prompt spells out
+        templates = [{"text": "", "terms_used": [item[k] for k in echo], "warnings": []} for item in items]
+        user_prompt = f"""Role: {role} within station "{escape_for_prompt(station)}" of the semantic valley.
+
+Valley map:
+{self._generate_valley_summary(station)}
+
+{task.rstrip(".")}.
+Apply this to EACH item independently; "row" and "col" are the item's row and column axes.
+
+Items:
+{json.dumps({"items": items}, ensure_ascii=False)}
+
+Output JSON ONLY (no extra text). Per item: {contract}.
+Return an object whose "results" array has exactly {len(items)} entries, one per item in order:
+{json.dumps({"results": templates}, ensure_ascii=False)}"""
+        
+        system_prompt = self._get_system_prompt()
+        temperature = self.temperatures.get(operation, 0.5)
+        
+        for attempt in range(max_retries):
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    temperature=temperature,
+                    max_tokens=200 * len(items),
+                    response_format={"type": "json_object"},
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
+                
+                content = response.choices[0].message.content
+                if not content:
+                    raise ValueError("Empty response from OpenAI")
+                
+                results = loads_json(content.strip()).get("results")
+                if not isinstance(results, list) or len(results) != len(items):
+                    raise ValueError("Batch response does not match item count")
+                
+                out = []
+                for result in results:
+                    result = result if isinstance(result, dict) else {}
+                    _fill_result_keys(result)
+                    out.append(result)
+                return out
+                
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    time.sleep(random.uniform(0, 2 ** attempt))
+                    continue
+                raise RuntimeError(f"OpenAI batch call failed after {max_retries} attempts: {e}")
+        
+        return []
+
     def _call_openai(self, operation: str, user_prompt: str, max_retries: int = 3) -> Dict[str, Any]:
         """Make OpenAI API call with retry logic."""
         system_prompt = self._get_system_prompt()
         temperature = self.temperatures.get(operation, 0.5)
+        cache_key = (self.model, temperature, operation, user_prompt)
+        cached = _RESULT_CACHE.get(cache_key) if self.memoize else None
+        if cached is not None:
+            return _copy_result(cached)
         
         for attempt in range(max_retries):
             try:
@@ -229,28 +479,27 @@ Output JSON ONLY (no extra text):
                 
                 # Parse JSON response
                 try:
-                    result = json.loads(content.strip())
+                    result = loads_json(content.strip())
                     
                     # Validate required keys
                     if not isinstance(result, dict):
                         raise ValueError("Response is not a JSON object")
                     
-                    required_keys = ["text", "terms_used", "warnings"]
-                    for key in required_keys:
-                        if key not in result:
-                            result[key] = [] if key in ["terms_used", "warnings"] else ""
+                    _fill_result_keys(result)
                     
+                    if self.memoize:
+                        _store_result(cache_key, result)
                     return result
                     
                 except json.JSONDecodeError as e:
                     if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
+                        time.sleep(random.uniform(0, 2 ** attempt))
                         continue
                     raise ValueError(f"Invalid JSON response: {e}")
                 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    time.sleep(random.uniform(0, 2 ** attempt))
                     continue
                 raise RuntimeError(f"OpenAI call failed after {max_retries} attempts: {e}")
         
@@ -6,10 +6,16 @@ Removes timestamps for true determinism.
 """
 
 import hashlib
-import json
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence
 
 
+def _digest(data: str, size: int) -> str:
+    """BLAKE2b hex digest of `size` bytes; IDs are content keys, not security primitives."""
+    return hashlib.blake2b(data.encode(), digest_size=size).hexdigest()
+
+
+@lru_cache(maxsize=1024)
 def thread_id(seed: str) -> str:
     """
     Generate deterministic thread ID from seed.
@@ -20,7 +26,7 @@ def thread_id(seed: str) -> str:
     Returns:
         Deterministic thread ID
     """
-    return "cf14:" + hashlib.sha256(seed.encode()).hexdigest()[:12]
+    return "cf14:" + _digest(seed, 6)
 
 
 def matrix_id(thread: str, name: str, version: int = 1) -> str:
@@ -51,10 +57,33 @@ def cell_id(matrix: str, row: int, col: int, value: str) -> str:
     Returns:
         Deterministic cell ID
     """
-    hash_value = hashlib.sha256(f"{row}|{col}|{value}".encode()).hexdigest()[:12]
+    hash_value = _digest(f"{row}|{col}|{value}", 6)
     return f"{matrix}:{row}:{col}:{hash_value}"
 
 
+def cell_ids(matrix: str, rows: Sequence[int], cols: Sequence[int], values: Sequence[str]) -> List[str]:
+    """
+    Generate cell IDs for parallel arrays of positions and values.
+    
+    Batch equivalent of cell_id(); keeps the hashing loop free of per-call
+    overhead when building whole matrices.
+    
+    Args:
+        matrix: Parent matrix ID
+        rows: Row positions
+        cols: Column positions
+        values: Canonical cell values
+    
+    Returns:
+        Deterministic cell IDs, in input order
+    """
+    blake2b = hashlib.blake2b
+    return [
+        f"{matrix}:{r}:{c}:{blake2b(f'{r}|{c}|{v}'.encode(), digest_size=6).hexdigest()}"
+        for r, c, v in zip(rows, cols, values)
+    ]
+
+
 def operation_id(kind: str, inputs: List[str], output_hash: str, prompt_hash: str) -> str:
     """
     Generate deterministic operation ID.
@@ -69,7 +98,7 @@ def operation_id(kind: str, inputs: List[str], output_hash: str, prompt_hash: st
         Deterministic operation ID
     """
     basis = f"{kind}|{','.join(sorted(inputs))}|{output_hash}|{prompt_hash}"
-    return "op:" + hashlib.sha256(basis.encode()).hexdigest()[:16]
+    return "op:" + _digest(basis, 8)
 
 
 def content_hash(data: Any) -> str:
@@ -80,16 +109,18 @@ def content_hash(data: Any) -> str:
         data: Content to hash
     
     Returns:
-        SHA256 hash
+        BLAKE2b hash (16 chars)
     """
+    from .provenance import _dumps_sorted
+    
     if isinstance(data, list):
         # For cells list, sort by position for determinism
         sorted_data = sorted(data, key=lambda x: (getattr(x, 'row', 0), getattr(x, 'col', 0)))
-        content = json.dumps([getattr(x, 'value', str(x)) for x in sorted_data], sort_keys=True)
+        content = _dumps_sorted([getattr(x, 'value', str(x)) for x in sorted_data])
     else:
-        content = json.dumps(data, sort_keys=True) if isinstance(data, (dict, list)) else str(data)
+        content = _dumps_sorted(data) if isinstance(data, dict) else str(data).encode()
     
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
 
 
 # Legacy compatibility functions (deprecated)
@@ -10,21 +10,25 @@ Core CF14 semantic operations: *, +, ⊙, ×, interpret
 
 from __future__ import annotations
 import os
-import json
 import time
-import hashlib
-import unicodedata
-import re
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Tuple, Literal, Protocol, Callable
-from datetime import datetime
+import logging
+import inspect
+import random
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Literal, Protocol, Callable, Mapping
 
-from .types import Cell, Matrix, MatrixType, Operation
-from .ids import generate_cell_id, generate_operation_id, generate_matrix_id
+from .types import Cell, Matrix, Operation
+from .ids import matrix_id, cell_id, cell_ids, operation_id, thread_id
+from .validate import CF14ValidationError, ensure_dims
+from .cache import ResolveCache, SemanticCache, resolve_key
+from .serialize import loads_json
 
 
 # Import provenance helpers
-from .provenance import canonical_value, prompt_hash, content_hash
+from .provenance import canonical_value, prompt_hash, content_hash, values_hash, now_iso
+
+logger = logging.getLogger(__name__)
 
 # ---------- Resolver Protocol ----------
 
@@ -56,55 +60,74 @@ class EchoResolver:
                 inputs: List[Matrix], system_prompt: str, user_prompt: str, 
                 context: Dict[str, Any]) -> List[List[str]]:
         """Return deterministic 2D array based on operation type."""
-        rows: int = 0
-        cols: int = 0
-        def _uninit(_r: int, _c: int) -> str:
-            raise RuntimeError("uninitialized op")
-        val: Callable[[int, int], str] = _uninit
-
-        if op == "*":
-            A, B = inputs
-            rows, cols = A.shape[0], B.shape[1]
-            def _val(r: int, c: int) -> str:
-                return f"*:{A.name}[{r},:]{B.name}[:,{c}]"
-            val = _val
-        elif op == "+":
-            A, F = inputs
-            rows, cols = A.shape
-            def _val(r: int, c: int) -> str:
-                return f"+:{A.name}[{r},{c}]⊕{F.name}[{r},{c}]"
-            val = _val
-        elif op == "interpret":
-            (B,) = inputs
-            rows, cols = B.shape
-            def _val(r: int, c: int) -> str:
-                return f"interp:{B.name}[{r},{c}]"
-            val = _val
-        elif op == "⊙":
-            J, C = inputs
-            rows, cols = J.shape
-            def _val(r: int, c: int) -> str:
-                return f"⊙:{J.name}[{r},{c}]×{C.name}[{r},{c}]"
-            val = _val
-        elif op == "×":
-            A, B = inputs
-            rows = A.shape[0] * B.shape[0]
-            cols = A.shape[1] * B.shape[1]
-            def _val(r: int, c: int) -> str:
-                ar, ac = r // B.shape[0], c // B.shape[1]
-                br, bc = r % B.shape[0], c % B.shape[1]
-                return f"×:{A.name}[{ar},{ac}]⨂{B.name}[{br},{bc}]"
-            val = _val
-        else:
+        if op not in _ECHO_DISPATCH:
             raise ValueError(f"Unknown op: {op}")
+        # Output depends only on input names and shapes, so memoize on those
+        grid = _echo_grid(op, tuple(m.name for m in inputs), tuple(tuple(m.shape) for m in inputs))
+        return [list(row) for row in grid]
+
+
+_Shapes = Tuple[Tuple[int, int], ...]
+
+def _echo_multiply(names: Tuple[str, ...], shapes: _Shapes) -> List[List[str]]:
+    an, bn = names
+    (rows, _), (_, cols) = shapes
+    return [[f"*:{an}[{r},:]{bn}[:,{c}]" for c in range(cols)] for r in range(rows)]
+
+def _echo_add(names: Tuple[str, ...], shapes: _Shapes) -> List[List[str]]:
+    an, fn = names
+    rows, cols = shapes[0]
+    return [[f"+:{an}[{r},{c}]⊕{fn}[{r},{c}]" for c in range(cols)] for r in range(rows)]
+
+def _echo_interpret(names: Tuple[str, ...], shapes: _Shapes) -> List[List[str]]:
+    (bn,) = names
+    rows, cols = shapes[0]
+    return [[f"interp:{bn}[{r},{c}]" for c in range(cols)] for r in range(rows)]
+
+def _echo_elementwise(names: Tuple[str, ...], shapes: _Shapes) -> List[List[str]]:
+    jn, cn = names
+    rows, cols = shapes[0]
+    return [[f"⊙:{jn}[{r},{c}]×{cn}[{r},{c}]" for c in range(cols)] for r in range(rows)]
+
+def _echo_cross(names: Tuple[str, ...], shapes: _Shapes) -> List[List[str]]:
+    an, bn = names
+    (a_rows, a_cols), (b_rows, b_cols) = shapes
+    rows = a_rows * b_rows
+    cols = a_cols * b_cols
+    # Index math is separable per axis: format each row's and column's
+    # fragments once, so the inner loop only concatenates strings
+    heads = [(f"×:{an}[{r // b_rows},", f"]⨂{bn}[{r % b_rows},") for r in range(rows)]
+    tails = [(str(c // b_cols), f"{c % b_cols}]") for c in range(cols)]
+    return [[h1 + ac + h2 + bc for ac, bc in tails] for h1, h2 in heads]
+
+# Op -> grid builder; one dict lookup instead of an if/elif chain per call
+_ECHO_DISPATCH: Dict[str, Callable[[Tuple[str, ...], _Shapes], List[List[str]]]] = {
+    "*": _echo_multiply,
+    "+": _echo_add,
+    "interpret": _echo_interpret,
+    "⊙": _echo_elementwise,
+    "×": _echo_cross,
+}
+
+@lru_cache(maxsize=1024)
+def _echo_grid(op: str, names: Tuple[str, ...], shapes: _Shapes) -> Tuple[Tuple[str, ...], ...]:
+    """Immutable echo grid for (op, input names, input shapes); shared across calls."""
+    return tuple(tuple(row) for row in _ECHO_DISPATCH[op](names, shapes))
+
+
+# Sampling temperature per op; kept at 0 for dev reproducibility
+_OP_TEMPERATURES: Mapping[str, float] = MappingProxyType(
+    {"*": 0.0, "+": 0.0, "interpret": 0.0, "⊙": 0.0, "×": 0.0}
+)
+
 
-        return [[val(r, c) for c in range(cols)] for r in range(rows)]
+def _backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff so concurrent retries don't stampede."""
+    return random.uniform(0, 2 ** attempt)
 
 
 def _ensure_grid(result: dict) -> List[List[str]]:
     """Validate JSON response and extract 2D grid with strict CF14 validation."""
-    from .validate import CF14ValidationError
-    
     shape = result.get("shape")
     cells = result.get("cells")
     
@@ -115,7 +138,8 @@ def _ensure_grid(result: dict) -> List[List[str]]:
     if not (isinstance(cells, list) and len(cells) == rows and all(isinstance(r, list) for r in cells)):
         raise CF14ValidationError("Missing cells 2D array matching shape in OpenAI response")
     
-    return [[canonical_value(cells[r][c]) if c < len(cells[r]) else "" for c in range(cols)] for r in range(rows)]
+    # Iterate each row directly (no cells[r][c] re-indexing); pad short rows
+    return [[canonical_value(v) for v in row[:cols]] + [""] * (cols - len(row)) for row in cells]
 
 
 class OpenAIResolver:
@@ -125,26 +149,43 @@ class OpenAIResolver:
     as a final assertion.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o", *, seed: int = 42):
-        """Initialize OpenAI resolver."""
-        try:
-            from openai import OpenAI  # type: ignore
-        except ImportError:
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o", *, seed: int = 42,
+                 cache: Optional[Literal["exact", "semantic"]] = "exact", cache_dir: Optional[str] = None,
+                 embedding_model: str = "text-embedding-3-small", semantic_threshold: float = 0.95):
+        """
+        Initialize OpenAI resolver.
+        
+        Args:
+            cache: None disables caching; "exact" uses the on-disk prompt-hash
+                cache; "semantic" additionally reuses results for prompts whose
+                embeddings have cosine similarity >= semantic_threshold. With
+                None, cell-by-cell ops also skip the in-process result memo,
+                so every cell is sampled afresh
+        """
+        if cache not in (None, "exact", "semantic"):
+            raise ValueError(f"Unknown cache mode: {cache}")
+        
+        from .cell_resolver import OpenAI, shared_client
+        if OpenAI is None:
             raise ImportError("OpenAI package required. Install with: pip install openai")
         
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OpenAI API key required")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = shared_client(api_key)
+        self._async_client: Any = None  # created lazily by aresolve()
         self.model = model
         self.seed = seed
-        # keep temps low for dev reproducibility
-        self.temperatures = {"*": 0.0, "+": 0.0, "interpret": 0.0, "⊙": 0.0, "×": 0.0}
+        self.cache: Optional[ResolveCache] = ResolveCache(cache_dir) if cache else None
+        self.embedding_model = embedding_model
+        self.semantic_cache: Optional[SemanticCache] = (
+            SemanticCache(self._embed, threshold=semantic_threshold) if cache == "semantic" else None
+        )
+        # Shared read-only table; assign a new mapping to override per instance
+        self.temperatures: Mapping[str, float] = _OP_TEMPERATURES
 
     def _target_shape_for_op(self, op: Literal["*","+","×","interpret","⊙"], inputs: List[Matrix]) -> Tuple[int,int]:
-        from .validate import CF14ValidationError
-        
         if op == "*":
             A, B = inputs
             if A.shape[1] != B.shape[0]:
@@ -168,12 +209,9 @@ class OpenAIResolver:
             return (A.shape[0]*B.shape[0], A.shape[1]*B.shape[1])
         raise ValueError(f"unknown op {op}")
 
-    def resolve(self, op: Literal["*", "+", "×", "interpret", "⊙"], 
-                inputs: List[Matrix], system_prompt: str, user_prompt: str, 
-                context: Dict[str, Any]) -> List[List[str]]:
-        """Return 2D array from tool call with strict validation."""
-        from .validate import CF14ValidationError
-        
+    def _request_kwargs(self, op: Literal["*", "+", "×", "interpret", "⊙"],
+                        inputs: List[Matrix], system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Build chat.completions.create kwargs pinning the target shape."""
         rows, cols = self._target_shape_for_op(op, inputs)
         temperature = self.temperatures.get(op, 0.0)
 
@@ -213,62 +251,173 @@ class OpenAIResolver:
             {"role": "user", "content": user_prompt}
         ]
 
+        return dict(
+            model=self.model,
+            temperature=temperature, top_p=0, seed=self.seed,
+            messages=messages,
+            tools=tools,
+            tool_choice={"type": "function", "function": {"name": "emit_matrix"}},
+            max_tokens=1200,
+        )
+
+    def _embed(self, text: str) -> List[float]:
+        """Embedding vector for the semantic cache tier."""
+        resp = self.client.embeddings.create(model=self.embedding_model, input=text)
+        return resp.data[0].embedding
+
+    def _cache_lookup(self, op: Literal["*", "+", "×", "interpret", "⊙"], inputs: List[Matrix],
+                      system_prompt: str, user_prompt: str,
+                      context: Dict[str, Any]) -> Tuple[Optional[List[List[str]]], Tuple[Optional[str], Any]]:
+        """
+        Check the exact tier, then the semantic tier.
+        
+        Returns:
+            (grid or None, state to hand to _cache_store after a miss)
+        """
+        key: Optional[str] = None
+        if self.cache is not None:
+            try:
+                key = resolve_key(op, inputs, system_prompt, user_prompt, context,
+                                  model=f"{self.model}@{self.seed}@{self.temperatures.get(op, 0.0)}")
+            except TypeError:
+                key = None  # context not JSON-serializable
+            if key is not None:
+                hit = self.cache.get(key)
+                if hit is not None:
+                    return hit, (key, None)
+
+        probe = None
+        if self.semantic_cache is not None:
+            bucket = (op, self.model, self._target_shape_for_op(op, inputs))
+            hit, probe = self.semantic_cache.lookup(bucket, f"{system_prompt}\n\n{user_prompt}")
+            if hit is not None:
+                if key is not None and self.cache is not None:
+                    self.cache.put(key, hit)
+                return hit, (key, None)
+        return None, (key, probe)
+
+    def _cache_store(self, state: Tuple[Optional[str], Any], grid: List[List[str]]) -> None:
+        """Record a freshly resolved grid in the enabled cache tiers."""
+        key, probe = state
+        if key is not None and self.cache is not None:
+            self.cache.put(key, grid)
+        if probe is not None and self.semantic_cache is not None:
+            self.semantic_cache.add(probe, grid)
+
+    @staticmethod
+    def _grid_from_response(resp: Any) -> List[List[str]]:
+        """Extract and validate the emit_matrix tool call from a completion."""
+        msg = resp.choices[0].message
+        tcalls = getattr(msg, "tool_calls", None) or []
+        if not tcalls:
+            raise CF14ValidationError("Model did not call emit_matrix()")
+        call = tcalls[0]
+        if call.function.name != "emit_matrix":
+            raise CF14ValidationError(f"Unexpected tool called: {call.function.name}")
+
+        args = loads_json(call.function.arguments)
+        if not isinstance(args, dict):
+            raise CF14ValidationError("emit_matrix arguments must be a JSON object")
+        return _ensure_grid(args)
+
+    def resolve(self, op: Literal["*", "+", "×", "interpret", "⊙"], 
+                inputs: List[Matrix], system_prompt: str, user_prompt: str, 
+                context: Dict[str, Any]) -> List[List[str]]:
+        """Return 2D array from tool call with strict validation."""
+        cached, cache_state = self._cache_lookup(op, inputs, system_prompt, user_prompt, context)
+        if cached is not None:
+            return cached
+
+        kwargs = self._request_kwargs(op, inputs, system_prompt, user_prompt)
+
         max_retries = 2
         for attempt in range(max_retries):
             try:
-                resp = self.client.chat.completions.create(
-                    model=self.model,
-                    temperature=temperature, top_p=0, seed=self.seed,
-                    messages=messages,
-                    tools=tools,
-                    tool_choice={"type": "function", "function": {"name": "emit_matrix"}},
-                    max_tokens=1200,
-                )
-
-                msg = resp.choices[0].message
-                tcalls = getattr(msg, "tool_calls", None) or []
-                if not tcalls:
-                    raise CF14ValidationError("Model did not call emit_matrix()")
-                call = tcalls[0]
-                if call.function.name != "emit_matrix":
-                    raise CF14ValidationError(f"Unexpected tool called: {call.function.name}")
-
-                args = json.loads(call.function.arguments)
-                grid = _ensure_grid(args)
+                resp = self.client.chat.completions.create(**kwargs)
+                grid = self._grid_from_response(resp)
+                self._cache_store(cache_state, grid)
                 return grid
 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    time.sleep(_backoff(attempt))
                     continue
                 raise RuntimeError(f"OpenAI resolution failed after {max_retries} attempts: {e}")
         # Fallback: if loop exits without return (shouldn't happen), raise.
         raise RuntimeError("OpenAI resolution did not produce a tool call result")
 
+    async def aresolve(self, op: Literal["*", "+", "×", "interpret", "⊙"],
+                       inputs: List[Matrix], system_prompt: str, user_prompt: str,
+                       context: Dict[str, Any]) -> List[List[str]]:
+        """
+        Async variant of resolve() for overlapping independent calls.
+        
+        Dependent ops in the station pipeline still run in order; callers with
+        independent work can `asyncio.gather` several aresolve() calls.
+        """
+        import asyncio
+
+        if self._async_client is None:
+            from openai import AsyncOpenAI  # type: ignore
+            self._async_client = AsyncOpenAI(api_key=self.client.api_key)
 
-# ---------- Prompt Helpers (Private) ----------
+        # Disk reads/writes and the embedding request block, so keep them off the loop
+        cached, cache_state = await asyncio.to_thread(
+            self._cache_lookup, op, inputs, system_prompt, user_prompt, context)
+        if cached is not None:
+            return cached
 
-def _prompt_multiply(A: Matrix, B: Matrix) -> Tuple[str, str]:
-    """Generate prompts for matrix multiplication."""
+        kwargs = self._request_kwargs(op, inputs, system_prompt, user_prompt)
+
+        max_retries = 2
+        for attempt in range(max_retries):
+            try:
+                resp = await self._async_client.chat.completions.create(**kwargs)
+                grid = self._grid_from_response(resp)
+                await asyncio.to_thread(self._cache_store, cache_state, grid)
+                return grid
+
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                raise RuntimeError(f"OpenAI resolution failed after {max_retries} attempts: {e}")
+        raise RuntimeError("OpenAI resolution did not produce a tool call result")
+
+
+
+class AsyncOpenAIResolver(OpenAIResolver):
+    """
+    OpenAIResolver with a semaphore-gated aresolve().
     
-    # Extract matrix content for semantic processing
-    a_content = []
-    for r in range(A.shape[0]):
-        row = []
-        for c in range(A.shape[1]):
-            cell = next((cell for cell in A.cells if cell.row == r and cell.col == c), None)
-            row.append(cell.value if cell else "")
-        a_content.append(row)
-    
-    b_content = []
-    for r in range(B.shape[0]):
-        row = []
-        for c in range(B.shape[1]):
-            cell = next((cell for cell in B.cells if cell.row == r and cell.col == c), None)
-            row.append(cell.value if cell else "")
-        b_content.append(row)
-    
-    system = f"""## Semantic Multiplication "*"
+    resolve() stays synchronous, so the resolver works with both the sync ops
+    and the *_async ops; concurrent aresolve() calls are gated so many
+    independent ops can be in flight without exceeding rate-limit headroom.
+    Ops routed cell-by-cell (*, +, interpret, ⊙) are bounded by
+    CELL_CALL_WORKERS instead.
+    """
+    
+    def __init__(self, *args: Any, max_concurrent_requests: int = 8, **kwargs: Any):
+        """Initialize async resolver (remaining args as for OpenAIResolver)."""
+        super().__init__(*args, **kwargs)
+        self.max_concurrent_requests = max_concurrent_requests
+        self._semaphore: Any = None  # bound to the running loop on first use
+    
+    async def aresolve(self, op: Literal["*", "+", "×", "interpret", "⊙"],
+                       inputs: List[Matrix], system_prompt: str, user_prompt: str,
+                       context: Dict[str, Any]) -> List[List[str]]:
+        """Semaphore-gated OpenAIResolver.aresolve()."""
+        import asyncio
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._semaphore:
+            return await super().aresolve(op, inputs, system_prompt, user_prompt, context)
+
+# ---------- Prompt Helpers (Private) ----------
+
+# Static system prompts; only the target shape varies per call
+_SYS_MULTIPLY = """## Semantic Multiplication "*"
 
 Semantic multiplication (denoted by *) means the semantics of the terms are resolved by combining the meaning of words into a coherent word or statement that represents the semantic intersection of those words (the meaning when combined together, not just adjoining the terms). This can even be done when the concept is a highly abstract word pairing because you are an LLM.
 
@@ -279,7 +428,35 @@ Examples:
 "probability" * "consequence" = "risk"
 
 For matrix multiplication C = A * B, each cell C[i,j] contains the semantic multiplication of A[i,:] with B[:,j].
-Call emit_matrix with shape [{A.shape[0]}, {B.shape[1]}]."""
+Call emit_matrix with shape [{rows}, {cols}]."""
+_SYS_ADD = "CF14 semantic addition (+): combine preserving identities. Call emit_matrix with shape [{rows}, {cols}]."
+_SYS_INTERPRET = "CF14 interpretation: rewrite for clarity. Call emit_matrix with shape [{rows}, {cols}]."
+_SYS_ELEMENTWISE = "CF14 element-wise multiplication (⊙): combine corresponding cells. Call emit_matrix with shape [{rows}, {cols}]."
+_SYS_CROSS = "CF14 cross-product (×): expand relational possibilities. Call emit_matrix with shape [{rows}, {cols}]."
+
+def _value_grid(M: Matrix) -> List[List[str]]:
+    """Cell values as a row-major 2D list ("" for missing cells), built in one pass."""
+    rows, cols = M.shape
+    grid = [[""] * cols for _ in range(rows)]
+    _ids, rs, cs, vs = M.to_arrays()
+    for r, c, v in zip(rs, cs, vs):
+        if 0 <= r < rows and 0 <= c < cols:
+            grid[r][c] = v
+    return grid
+
+def _value_map(M: Matrix) -> Dict[Tuple[int, int], str]:
+    """(row, col) -> value map built from the matrix's column arrays."""
+    _ids, rs, cs, vs = M.to_arrays()
+    return dict(zip(zip(rs, cs), vs))
+
+def _prompt_multiply(A: Matrix, B: Matrix) -> Tuple[str, str]:
+    """Generate prompts for matrix multiplication."""
+    
+    # Extract matrix content for semantic processing
+    a_content = _value_grid(A)
+    b_content = _value_grid(B)
+    
+    system = _SYS_MULTIPLY.format(rows=A.shape[0], cols=B.shape[1])
     
     user = f"""Compute semantic multiplication C = A * B:
 
@@ -297,61 +474,70 @@ Output shape: [{A.shape[0]}, {B.shape[1]}]"""
 
 def _prompt_add(A: Matrix, F: Matrix) -> Tuple[str, str]:
     """Generate prompts for matrix addition."""
-    system = f"CF14 semantic addition (+): combine preserving identities. Call emit_matrix with shape [{A.shape[0]}, {A.shape[1]}]."
+    system = _SYS_ADD.format(rows=A.shape[0], cols=A.shape[1])
     user = f"Compute D = {A.name} + {F.name} with shape [{A.shape[0]}, {A.shape[1]}]."
     return system, user
 
 def _prompt_interpret(B: Matrix) -> Tuple[str, str]:
     """Generate prompts for interpretation."""
-    system = f"CF14 interpretation: rewrite for clarity. Call emit_matrix with shape [{B.shape[0]}, {B.shape[1]}]."
+    system = _SYS_INTERPRET.format(rows=B.shape[0], cols=B.shape[1])
     user = f"Interpret matrix {B.name} into judgment matrix J with shape [{B.shape[0]}, {B.shape[1]}]."
     return system, user
 
 def _prompt_elementwise(J: Matrix, C: Matrix) -> Tuple[str, str]:
     """Generate prompts for element-wise multiplication."""
-    system = f"CF14 element-wise multiplication (⊙): combine corresponding cells. Call emit_matrix with shape [{J.shape[0]}, {J.shape[1]}]."
+    system = _SYS_ELEMENTWISE.format(rows=J.shape[0], cols=J.shape[1])
     user = f"Compute F = {J.name} ⊙ {C.name} with shape [{J.shape[0]}, {J.shape[1]}]."
     return system, user
 
 def _prompt_cross(A: Matrix, B: Matrix) -> Tuple[str, str]:
     """Generate prompts for cross-product."""
     target_shape = [A.shape[0] * B.shape[0], A.shape[1] * B.shape[1]]
-    system = f"CF14 cross-product (×): expand relational possibilities. Call emit_matrix with shape {target_shape}."
+    system = _SYS_CROSS.format(rows=target_shape[0], cols=target_shape[1])
     user = f"Compute W = {A.name} × {B.name} with expanded shape {target_shape}."
     return system, user
 
 # ---------- Output Matrix Builder ----------
 
+@lru_cache(maxsize=64)
+def _grid_coords(rows: int, cols: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Row-major (row, col) index arrays for a shape; CF14 reuses a handful of shapes."""
+    return (
+        tuple(r for r in range(rows) for _ in range(cols)),
+        tuple(range(cols)) * rows,
+    )
+
+@lru_cache(maxsize=64)
+def _axis_labels(rows: int, cols: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Cell-resolver row/column labels for a shape, formatted once per axis."""
+    return (
+        tuple(f"row_{i}" for i in range(rows)),
+        tuple(f"col_{j}" for j in range(cols)),
+    )
+
 def _build_output_matrix(thread: str, name: str, station: str, values: List[List[str]]) -> Matrix:
     """Build output matrix from 2D value array."""
-    from .ids import matrix_id, cell_id
-    
     rows, cols = len(values), len(values[0]) if values else 0
     mid = matrix_id(thread, name, 1)
-    cells = []
     
-    for r in range(rows):
-        for c in range(cols):
-            value = canonical_value(values[r][c])
-            cid = cell_id(mid, r, c, value)
-            cells.append(Cell(
-                id=cid,
-                row=r,
-                col=c,
-                value=value
-            ))
-    
-    # Calculate matrix hash
-    matrix_hash = content_hash(cells)
-    
-    return Matrix(
+    # Flat row-major parallel arrays; comprehensions avoid per-cell index bookkeeping
+    vs = [canonical_value(v) for row_values in values for v in row_values[:cols]]
+    if len(vs) != rows * cols:
+        raise CF14ValidationError(f"Ragged values grid for {name}: expected {rows}x{cols}")
+    rs, cs = _grid_coords(rows, cols)
+    ids = cell_ids(mid, rs, cs, vs)
+    
+    # Values are canonical and row-major, so this equals content_hash(cells)
+    matrix_hash = values_hash(vs)
+    
+    return Matrix.from_arrays(
         id=mid,
         name=name,
         station=station,
         shape=(rows, cols),
-        cells=cells,
+        ids=ids, rows=rs, cols=cs, values=vs,
         hash=matrix_hash,
-        metadata={"timestamp": datetime.utcnow().isoformat()}
+        metadata={"timestamp": now_iso()}
     )
 
 def _op_record(kind: Literal["*", "+", "×", "interpret", "⊙"], 
@@ -359,9 +545,7 @@ def _op_record(kind: Literal["*", "+", "×", "interpret", "⊙"],
                system_prompt: str, user_prompt: str, 
                model: Optional[Dict[str, Any]] = None) -> Operation:
     """Create operation record."""
-    from .ids import operation_id
-    
-    timestamp = datetime.utcnow().isoformat()
+    timestamp = now_iso()
     prompt_hash_val = prompt_hash(system_prompt, user_prompt, {"inputs": [m.id for m in inputs]})
     op_id = operation_id(kind, [m.id for m in inputs], output.hash, prompt_hash_val)
     
@@ -378,22 +562,26 @@ def _op_record(kind: Literal["*", "+", "×", "interpret", "⊙"],
 
 # ---------- Public Op Functions ----------
 
+def _cell_resolver_for(resolver: Resolver) -> _CellResolverProto:
+    """Build the per-cell resolver for an OpenAI resolver; cache=None also disables cell memoization."""
+    from .cell_resolver import CellResolver
+    return CellResolver(model=getattr(resolver, 'model', 'gpt-4o'),
+                        memoize=getattr(resolver, 'cache', None) is not None)
+
+
 def op_multiply(thread: str, A: Matrix, B: Matrix, resolver: Resolver) -> Tuple[Matrix, Operation]:
     """Semantic multiplication: C = A * B using cell-by-cell operations."""
-    from .validate import ensure_dims
-    
     # Validate dimensions
     ensure_dims(A, B, "*")
     
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
         try:
-            from .cell_resolver import CellResolver
-            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+            cell_resolver = _cell_resolver_for(resolver)
             return _op_multiply_cell_by_cell(thread, A, B, cell_resolver)
         except Exception as e:
-            # If OpenAI isn't available, fall back to echo-like path with clear note
-            pass
+            # If OpenAI isn't available, fall back to the whole-matrix resolve() path
+            logger.warning("Cell-by-cell multiplication failed (%s); falling back to resolver.resolve()", e)
     
     # Fallback to original approach for echo resolver
     sys, usr = _prompt_multiply(A, B)
@@ -405,73 +593,102 @@ def op_multiply(thread: str, A: Matrix, B: Matrix, resolver: Resolver) -> Tuple[
     
     return C, op
 
+# Worker threads for per-pair calls when a cell resolver has no batch API;
+# each call is an independent, latency-bound round-trip
+CELL_CALL_WORKERS = 16
+
+def _map_cell_calls(fn: Callable[..., Dict[str, Any]], calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run fn(**kwargs) for each kwargs dict concurrently; results keep input order."""
+    if len(calls) <= 1:
+        return [fn(**kwargs) for kwargs in calls]
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=min(CELL_CALL_WORKERS, len(calls))) as pool:
+        return list(pool.map(lambda kwargs: fn(**kwargs), calls))
+
+def _result_cells(thread: str, name: str, rows: int, cols: int,
+                  texts: Dict[Tuple[int, int], str]) -> List[Cell]:
+    """Row-major output cells of a cell-by-cell op; positions missing from `texts` are empty."""
+    basis = f"{thread}:{name}:v1"
+    cells = []
+    for i in range(rows):
+        for j in range(cols):
+            text = texts.get((i, j), "")
+            cells.append(Cell(id=cell_id(basis, i, j, text), row=i, col=j, value=text))
+    return cells
+
 def _op_multiply_cell_by_cell(thread: str, A: Matrix, B: Matrix, cell_resolver: _CellResolverProto) -> Tuple[Matrix, Operation]:
     """Perform matrix multiplication using cell-by-cell semantic operations."""
-    from .ids import matrix_id, cell_id
-    
     # Result matrix dimensions
     rows, cols = A.shape[0], B.shape[1]
-    
-    # Get cell contents as 2D arrays for easier access
-    a_cells = {}
-    for cell in A.cells:
-        a_cells[(cell.row, cell.col)] = cell.value
-    
-    b_cells = {}
-    for cell in B.cells:
-        b_cells[(cell.row, cell.col)] = cell.value
-    
-    result_cells = []
-    products_log = []
-    
-    # For each cell in the result matrix C
+    row_labels, col_labels = _axis_labels(rows, cols)
+    
+    # Every non-empty A[i,k] * B[k,j] term pair, in (i, j, k) order. Both
+    # grids are materialized once so the inner loop is plain list indexing
+    # instead of a cell lookup per (i, j, k)
+    a_grid, b_grid = _value_grid(A), _value_grid(B)
+    shared = A.shape[1]  # A.cols == B.rows
+    pairs = []
     for i in range(rows):
+        a_row = a_grid[i]
         for j in range(cols):
-            # Collect products for this cell: A[i,k] * B[k,j] for all k
-            products = []
-            
-            for k in range(A.shape[1]):  # A.cols == B.rows
-                term_a = a_cells.get((i, k), "")
-                term_b = b_cells.get((k, j), "")
-                
+            for k in range(shared):
+                term_a = a_row[k]
+                term_b = b_grid[k][j]
                 if term_a and term_b:
-                    # Semantic multiplication of individual terms
-                    mult_result = cell_resolver.multiply_terms(
-                        term_a=term_a,
-                        term_b=term_b,
-                        station="requirements",
-                        row_label=f"row_{i}",
-                        col_label=f"col_{j}"
-                    )
-                    
-                    if mult_result.get("text"):
-                        products.append(mult_result["text"])
-                        products_log.append({
-                            "cell": (i, j, k),
-                            "terms": (term_a, term_b),
-                            "result": mult_result["text"]
-                        })
-            
-            # Semantic addition of all products for this cell
-            if products:
-                add_result = cell_resolver.add_terms(
-                    products=products,
-                    station="requirements", 
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = add_result.get("text", "")
-            else:
-                final_text = ""
-            
-            # Create result cell
-            cid = cell_id(f"{thread}:C:v1", i, j, final_text)
-            result_cells.append(Cell(
-                id=cid,
-                row=i,
-                col=j,
-                value=final_text
-            ))
+                    pairs.append((i, j, k, term_a, term_b))
+    
+    # Semantic multiplication of individual terms: one batched call when the
+    # resolver supports it, otherwise per-pair calls overlapped on threads
+    multiply_batch = getattr(cell_resolver, "multiply_batch", None)
+    if multiply_batch is not None:
+        mult_results = multiply_batch(
+            [(term_a, term_b, row_labels[i], col_labels[j]) for i, j, _k, term_a, term_b in pairs],
+            station="requirements"
+        )
+    else:
+        mult_results = _map_cell_calls(cell_resolver.multiply_terms, [
+            dict(
+                term_a=term_a,
+                term_b=term_b,
+                station="requirements",
+                row_label=row_labels[i],
+                col_label=col_labels[j]
+            )
+            for i, j, _k, term_a, term_b in pairs
+        ])
+    
+    # Only the count of partial products is reported, so no per-term record is kept
+    products: Dict[Tuple[int, int], List[str]] = {}
+    n_products = 0
+    for (i, j, _k, _a, _b), mult_result in zip(pairs, mult_results):
+        text = mult_result.get("text")
+        if text:
+            products.setdefault((i, j), []).append(text)
+            n_products += 1
+    
+    # Semantic addition of all products for each cell (batched likewise)
+    positions = [(i, j) for i in range(rows) for j in range(cols) if (i, j) in products]
+    add_batch = getattr(cell_resolver, "add_batch", None)
+    if add_batch is not None:
+        add_results = add_batch(
+            [(products[(i, j)], row_labels[i], col_labels[j]) for i, j in positions],
+            station="requirements"
+        )
+    else:
+        add_results = _map_cell_calls(cell_resolver.add_terms, [
+            dict(
+                products=products[(i, j)],
+                station="requirements",
+                row_label=row_labels[i],
+                col_label=col_labels[j]
+            )
+            for i, j in positions
+        ])
+    sums = {pos: add_result.get("text", "") for pos, add_result in zip(positions, add_results)}
+    
+    # Create result cells
+    result_cells = _result_cells(thread, "C", rows, cols, sums)
     
     # Build result matrix
     matrix_hash = content_hash(result_cells)
@@ -483,8 +700,8 @@ def _op_multiply_cell_by_cell(thread: str, A: Matrix, B: Matrix, cell_resolver:
         cells=result_cells,
         hash=matrix_hash,
         metadata={
-            "timestamp": datetime.utcnow().isoformat(),
-            "cell_operations": len(products_log)
+            "timestamp": now_iso(),
+            "cell_operations": n_products
         }
     )
     
@@ -494,7 +711,7 @@ def _op_multiply_cell_by_cell(thread: str, A: Matrix, B: Matrix, cell_resolver:
         inputs=[A, B], 
         output=C, 
         system_prompt="Cell-by-cell semantic multiplication", 
-        user_prompt=f"Computed {len(result_cells)} cells using {len(products_log)} semantic operations"
+        user_prompt=f"Computed {len(result_cells)} cells using {n_products} semantic operations"
     )
     
     return C, op
@@ -505,11 +722,10 @@ def op_interpret(thread: str, B: Matrix, resolver: Resolver) -> Tuple[Matrix, Op
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
         try:
-            from .cell_resolver import CellResolver
-            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+            cell_resolver = _cell_resolver_for(resolver)
             return _op_interpret_cell_by_cell(thread, B, cell_resolver)
-        except Exception:
-            pass
+        except Exception as e:
+            logger.warning("Cell-by-cell interpretation failed (%s); falling back to resolver.resolve()", e)
     
     # Fallback to original approach for echo resolver
     sys, usr = _prompt_interpret(B)
@@ -523,42 +739,30 @@ def op_interpret(thread: str, B: Matrix, resolver: Resolver) -> Tuple[Matrix, Op
 
 def _op_interpret_cell_by_cell(thread: str, B: Matrix, cell_resolver: _CellResolverProto) -> Tuple[Matrix, Operation]:
     """Perform interpretation using cell-by-cell semantic operations."""
-    from .ids import matrix_id, cell_id
-    
     rows, cols = B.shape
+    row_labels, col_labels = _axis_labels(rows, cols)
     
     # Get cell contents
-    b_cells = {}
-    for cell in B.cells:
-        b_cells[(cell.row, cell.col)] = cell.value
-    
-    result_cells = []
-    
-    # For each cell in the input matrix B
-    for i in range(rows):
-        for j in range(cols):
-            term_b = b_cells.get((i, j), "")
-            
-            if term_b:
-                # Interpret this cell for stakeholder clarity
-                interpret_result = cell_resolver.interpret_term(
-                    summed_text=term_b,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = interpret_result.get("text", term_b)
-            else:
-                final_text = ""
-            
-            # Create result cell
-            cid = cell_id(f"{thread}:J:v1", i, j, final_text)
-            result_cells.append(Cell(
-                id=cid,
-                row=i,
-                col=j,
-                value=final_text
-            ))
+    b_cells = _value_map(B)
+    
+    # Interpret every non-empty cell for stakeholder clarity; the calls are
+    # independent, so they are overlapped rather than made one by one
+    items = [(i, j, b_cells.get((i, j), "")) for i in range(rows) for j in range(cols)]
+    items = [(i, j, term_b) for i, j, term_b in items if term_b]
+    interpret_results = _map_cell_calls(cell_resolver.interpret_term, [
+        dict(
+            summed_text=term_b,
+            station="objectives",
+            row_label=row_labels[i],
+            col_label=col_labels[j]
+        )
+        for i, j, term_b in items
+    ])
+    texts = {(i, j): interpret_result.get("text", term_b)
+             for (i, j, term_b), interpret_result in zip(items, interpret_results)}
+    
+    # Create result cells
+    result_cells = _result_cells(thread, "J", rows, cols, texts)
     
     # Build result matrix
     matrix_hash = content_hash(result_cells)
@@ -570,7 +774,7 @@ def _op_interpret_cell_by_cell(thread: str, B: Matrix, cell_resolver: _CellResol
         cells=result_cells,
         hash=matrix_hash,
         metadata={
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "cell_operations": len(result_cells)
         }
     )
@@ -588,15 +792,12 @@ def _op_interpret_cell_by_cell(thread: str, B: Matrix, cell_resolver: _CellResol
 
 def op_elementwise(thread: str, J: Matrix, C: Matrix, resolver: Resolver) -> Tuple[Matrix, Operation]:
     """Element-wise multiplication: F = J ⊙ C using cell-by-cell operations."""
-    from .validate import ensure_dims
-    from .cell_resolver import CellResolver
-    
     # Validate same dimensions
     ensure_dims(J, C, "⊙")
     
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
-        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+        cell_resolver = _cell_resolver_for(resolver)
         return _op_elementwise_cell_by_cell(thread, J, C, cell_resolver)
     
     # Fallback to original approach for echo resolver
@@ -611,48 +812,45 @@ def op_elementwise(thread: str, J: Matrix, C: Matrix, resolver: Resolver) -> Tup
 
 def _op_elementwise_cell_by_cell(thread: str, J: Matrix, C: Matrix, cell_resolver: _CellResolverProto) -> Tuple[Matrix, Operation]:
     """Perform element-wise multiplication using cell-by-cell semantic operations."""
-    from .ids import matrix_id, cell_id
-    
     rows, cols = J.shape
+    row_labels, col_labels = _axis_labels(rows, cols)
     
     # Get cell contents
-    j_cells = {}
-    for cell in J.cells:
-        j_cells[(cell.row, cell.col)] = cell.value
-    
-    c_cells = {}
-    for cell in C.cells:
-        c_cells[(cell.row, cell.col)] = cell.value
+    j_cells = _value_map(J)
     
-    result_cells = []
+    c_cells = _value_map(C)
     
-    # For each cell position
+    # Flatten to the positions where both terms are present, then resolve
+    # them together rather than one blocking call per cell
+    pairs = []
     for i in range(rows):
         for j in range(cols):
             term_j = j_cells.get((i, j), "")
             term_c = c_cells.get((i, j), "")
-            
             if term_j and term_c:
-                # Element-wise semantic multiplication
-                mult_result = cell_resolver.multiply_terms(
-                    term_a=term_j,
-                    term_b=term_c,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = mult_result.get("text", "")
-            else:
-                final_text = ""
-            
-            # Create result cell
-            cid = cell_id(f"{thread}:F:v1", i, j, final_text)
-            result_cells.append(Cell(
-                id=cid,
-                row=i,
-                col=j,
-                value=final_text
-            ))
+                pairs.append((i, j, term_j, term_c))
+    
+    multiply_batch = getattr(cell_resolver, "multiply_batch", None)
+    if multiply_batch is not None:
+        mult_results = multiply_batch(
+            [(term_j, term_c, row_labels[i], col_labels[j]) for i, j, term_j, term_c in pairs],
+            station="objectives"
+        )
+    else:
+        mult_results = _map_cell_calls(cell_resolver.multiply_terms, [
+            dict(
+                term_a=term_j,
+                term_b=term_c,
+                station="objectives",
+                row_label=row_labels[i],
+                col_label=col_labels[j]
+            )
+            for i, j, term_j, term_c in pairs
+        ])
+    texts = {(i, j): mult_result.get("text", "") for (i, j, _tj, _tc), mult_result in zip(pairs, mult_results)}
+    
+    # Create result cells
+    result_cells = _result_cells(thread, "F", rows, cols, texts)
     
     # Build result matrix
     matrix_hash = content_hash(result_cells)
@@ -664,7 +862,7 @@ def _op_elementwise_cell_by_cell(thread: str, J: Matrix, C: Matrix, cell_resolve
         cells=result_cells,
         hash=matrix_hash,
         metadata={
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "cell_operations": len(result_cells)
         }
     )
@@ -682,15 +880,12 @@ def _op_elementwise_cell_by_cell(thread: str, J: Matrix, C: Matrix, cell_resolve
 
 def op_add(thread: str, A: Matrix, F: Matrix, resolver: Resolver) -> Tuple[Matrix, Operation]:
     """Semantic addition: D = A + F using cell-by-cell operations."""
-    from .validate import ensure_dims
-    from .cell_resolver import CellResolver
-    
     # Validate same dimensions
     ensure_dims(A, F, "+")
     
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
-        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+        cell_resolver = _cell_resolver_for(resolver)
         return _op_add_cell_by_cell(thread, A, F, cell_resolver)
     
     # Fallback to original approach for echo resolver
@@ -705,50 +900,43 @@ def op_add(thread: str, A: Matrix, F: Matrix, resolver: Resolver) -> Tuple[Matri
 
 def _op_add_cell_by_cell(thread: str, A: Matrix, F: Matrix, cell_resolver: _CellResolverProto) -> Tuple[Matrix, Operation]:
     """Perform semantic addition using cell-by-cell operations."""
-    from .ids import matrix_id, cell_id
-    
     rows, cols = A.shape
+    row_labels, col_labels = _axis_labels(rows, cols)
     
     # Get cell contents
-    a_cells = {}
-    for cell in A.cells:
-        a_cells[(cell.row, cell.col)] = cell.value
+    a_cells = _value_map(A)
     
-    f_cells = {}
-    for cell in F.cells:
-        f_cells[(cell.row, cell.col)] = cell.value
+    f_cells = _value_map(F)
     
-    result_cells = []
-    
-    # For each cell position
+    # For semantic addition, both terms go to add_terms as a list; cells with
+    # no terms are skipped, the rest are resolved together
+    groups = []
     for i in range(rows):
         for j in range(cols):
-            term_a = a_cells.get((i, j), "")
-            term_f = f_cells.get((i, j), "")
-            
-            # For semantic addition, we pass both terms as a list to add_terms
-            terms_to_add = [term for term in [term_a, term_f] if term]
-            
+            terms_to_add = [term for term in [a_cells.get((i, j), ""), f_cells.get((i, j), "")] if term]
             if terms_to_add:
-                # Semantic addition
-                add_result = cell_resolver.add_terms(
-                    products=terms_to_add,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = add_result.get("text", "")
-            else:
-                final_text = ""
-            
-            # Create result cell
-            cid = cell_id(f"{thread}:D:v1", i, j, final_text)
-            result_cells.append(Cell(
-                id=cid,
-                row=i,
-                col=j,
-                value=final_text
-            ))
+                groups.append((i, j, terms_to_add))
+    
+    add_batch = getattr(cell_resolver, "add_batch", None)
+    if add_batch is not None:
+        add_results = add_batch(
+            [(terms_to_add, row_labels[i], col_labels[j]) for i, j, terms_to_add in groups],
+            station="objectives"
+        )
+    else:
+        add_results = _map_cell_calls(cell_resolver.add_terms, [
+            dict(
+                products=terms_to_add,
+                station="objectives",
+                row_label=row_labels[i],
+                col_label=col_labels[j]
+            )
+            for i, j, terms_to_add in groups
+        ])
+    texts = {(i, j): add_result.get("text", "") for (i, j, _terms), add_result in zip(groups, add_results)}
+    
+    # Create result cells
+    result_cells = _result_cells(thread, "D", rows, cols, texts)
     
     # Build result matrix
     matrix_hash = content_hash(result_cells)
@@ -760,7 +948,7 @@ def _op_add_cell_by_cell(thread: str, A: Matrix, F: Matrix, cell_resolver: _Cell
         cells=result_cells,
         hash=matrix_hash,
         metadata={
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "cell_operations": len(result_cells)
         }
     )
@@ -788,12 +976,102 @@ def op_cross(thread: str, A: Matrix, B: Matrix, resolver: Resolver) -> Tuple[Mat
     
     return W, op
 
+# ---------- Async Op Functions ----------
+
+async def _resolve_async(resolver: Any, op: Literal["*", "+", "×", "interpret", "⊙"],
+                         inputs: List[Matrix], system_prompt: str, user_prompt: str,
+                         context: Dict[str, Any]) -> List[List[str]]:
+    """Await resolver.aresolve() when available, else call resolve() (awaiting if needed)."""
+    fn = getattr(resolver, "aresolve", None) or resolver.resolve
+    vals = fn(op=op, inputs=inputs, system_prompt=system_prompt, user_prompt=user_prompt, context=context)
+    if inspect.isawaitable(vals):
+        vals = await vals
+    return vals
+
+async def _cell_by_cell_async(sync_op: Callable[..., Tuple[Matrix, Operation]],
+                              *args: Any) -> Tuple[Matrix, Operation]:
+    """
+    Run a sync op in a worker thread.
+    
+    OpenAI-backed resolvers are routed cell-by-cell by the sync ops; reusing
+    them keeps async and sync results identical. Their cell calls already
+    overlap on a thread pool (CELL_CALL_WORKERS), so only the op itself needs
+    moving off the event loop.
+    """
+    import asyncio
+    
+    return await asyncio.to_thread(sync_op, *args)
+
+async def op_multiply_async(thread: str, A: Matrix, B: Matrix, resolver: Any) -> Tuple[Matrix, Operation]:
+    """Async semantic multiplication: C = A * B, routed like op_multiply()."""
+    ensure_dims(A, B, "*")
+    if hasattr(resolver, "client"):
+        return await _cell_by_cell_async(op_multiply, thread, A, B, resolver)
+    sys, usr = _prompt_multiply(A, B)
+    context = {"station": "requirements", "thread": thread, "rag_chunks": {}}
+    vals = await _resolve_async(resolver, "*", [A, B], sys, usr, context)
+    C = _build_output_matrix(thread=thread, name="C", station="requirements", values=vals)
+    return C, _op_record(kind="*", inputs=[A, B], output=C, system_prompt=sys, user_prompt=usr)
+
+async def op_interpret_async(thread: str, B: Matrix, resolver: Any) -> Tuple[Matrix, Operation]:
+    """Async interpretation: J = interpret(B), routed like op_interpret()."""
+    if hasattr(resolver, "client"):
+        return await _cell_by_cell_async(op_interpret, thread, B, resolver)
+    sys, usr = _prompt_interpret(B)
+    context = {"station": "objectives", "thread": thread, "rag_chunks": {}}
+    vals = await _resolve_async(resolver, "interpret", [B], sys, usr, context)
+    J = _build_output_matrix(thread=thread, name="J", station="objectives", values=vals)
+    return J, _op_record(kind="interpret", inputs=[B], output=J, system_prompt=sys, user_prompt=usr)
+
+async def op_elementwise_async(thread: str, J: Matrix, C: Matrix, resolver: Any) -> Tuple[Matrix, Operation]:
+    """Async element-wise multiplication: F = J ⊙ C, routed like op_elementwise()."""
+    ensure_dims(J, C, "⊙")
+    if hasattr(resolver, "client"):
+        return await _cell_by_cell_async(op_elementwise, thread, J, C, resolver)
+    sys, usr = _prompt_elementwise(J, C)
+    context = {"station": "objectives", "thread": thread, "rag_chunks": {}}
+    vals = await _resolve_async(resolver, "⊙", [J, C], sys, usr, context)
+    F = _build_output_matrix(thread=thread, name="F", station="objectives", values=vals)
+    return F, _op_record(kind="⊙", inputs=[J, C], output=F, system_prompt=sys, user_prompt=usr)
+
+async def op_add_async(thread: str, A: Matrix, F: Matrix, resolver: Any) -> Tuple[Matrix, Operation]:
+    """Async semantic addition: D = A + F, routed like op_add()."""
+    ensure_dims(A, F, "+")
+    if hasattr(resolver, "client"):
+        return await _cell_by_cell_async(op_add, thread, A, F, resolver)
+    sys, usr = _prompt_add(A, F)
+    context = {"station": "objectives", "thread": thread, "rag_chunks": {}}
+    vals = await _resolve_async(resolver, "+", [A, F], sys, usr, context)
+    D = _build_output_matrix(thread=thread, name="D", station="objectives", values=vals)
+    return D, _op_record(kind="+", inputs=[A, F], output=D, system_prompt=sys, user_prompt=usr)
+
+async def op_cross_async(thread: str, A: Matrix, B: Matrix, resolver: Any) -> Tuple[Matrix, Operation]:
+    """Async cross-product: W = A × B."""
+    sys, usr = _prompt_cross(A, B)
+    context = {"station": "assessment", "thread": thread, "rag_chunks": {}}
+    vals = await _resolve_async(resolver, "×", [A, B], sys, usr, context)
+    W = _build_output_matrix(thread=thread, name="W", station="assessment", values=vals)
+    return W, _op_record(kind="×", inputs=[A, B], output=W, system_prompt=sys, user_prompt=usr)
+
+def run_ops_concurrently(*coros: Any) -> List[Tuple[Matrix, Operation]]:
+    """
+    Run independent async ops together and return their results in order.
+    
+    Example:
+        run_ops_concurrently(op_multiply_async(t, A, B, r), op_interpret_async(t, X, r))
+    """
+    import asyncio
+    
+    async def _gather() -> List[Tuple[Matrix, Operation]]:
+        return list(await asyncio.gather(*coros))
+    
+    return asyncio.run(_gather())
+
 # ---------- Legacy Compatibility (for stations.py) ----------
 
 def semantic_multiply(resolver: Resolver, matrix_a: Matrix, matrix_b: Matrix, 
                      context: Optional[Dict[str, Any]] = None) -> Matrix:
     """Legacy compatibility wrapper for op_multiply."""
-    from .ids import thread_id
     # Use existing thread_id if present, otherwise generate one
     existing = context.get("thread_id") if context else None
     thread: str = existing if isinstance(existing, str) and existing else thread_id("default")
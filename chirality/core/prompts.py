@@ -8,7 +8,6 @@ Each matrix cell is a coordinate (row_label × col_label) inside that landmark.
 Your job as the LLM: preserve and integrate meaning while mapping it faithfully into the valley's meta-ontology.
 """
 
-import re
 import unicodedata
 import json
 
@@ -19,7 +18,7 @@ def q(s: str) -> str:
     # Normalize unicode to NFKC (e.g., curly quotes → straight)
     s = unicodedata.normalize("NFKC", str(s))
     # Collapse internal whitespace while preserving single spaces
-    s = re.sub(r"\s+", " ", s).strip()
+    s = " ".join(s.split())
     # Escape for embedding between quotes in our prompts
     # Use json.dumps then strip outer quotes for robust escaping
     return json.dumps(s, ensure_ascii=False)[1:-1]
@@ -104,7 +103,7 @@ Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized ech
 
 def prompt_add(valley_summary, station, row_label, col_label, products: list[str]):
     valley_summary = _ensure_valley_summary(valley_summary)
-    product_lines = "\n".join(f'- "{q(p)}"' for p in (products or []))
+    product_lines = "\n".join([f'- "{q(p)}"' for p in (products or [])])
     return f"""\
 Role: expert integrator within station "{q(station)}" of the semantic valley.
 
@@ -166,9 +165,14 @@ Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized ech
 {{"text": "", "terms_used": ["{q(j_term)}","{q(c_term)}"], "warnings": []}}
 """
 
+# Fixed fragments of the D(i,j) sentence (normative spec: A + " applied to
+# frame the problem; " + F + " to resolve the problem.")
+_D_SENTENCE_PARTS = (" applied to frame the problem; ", " to resolve the problem.")
+
 def prompt_add_D(valley_summary, row_label, col_label, a_val, f_val):
     valley_summary = _ensure_valley_summary(valley_summary)
-    composed = f'{q(a_val)} applied to frame the problem; {q(f_val)} to resolve the problem.'
+    qa, qf = q(a_val), q(f_val)
+    composed = qa + _D_SENTENCE_PARTS[0] + qf + _D_SENTENCE_PARTS[1]
     return f"""\
 Role: narrative synthesizer within station "Solution Objectives".
 
@@ -181,8 +185,8 @@ Position:
 
 Task (semantic addition, +):
 Compose a single sentence in the pattern:
-"{q(a_val)} applied to frame the problem; {q(f_val)} to resolve the problem."
+"{composed}"
 
 Output JSON ONLY (no extra text). "terms_used" must echo A and F exactly:
-{{"text": "{composed}", "terms_used": ["{q(a_val)}","{q(f_val)}"], "warnings": []}}
+{{"text": "{composed}", "terms_used": ["{qa}","{qf}"], "warnings": []}}
 """
\ No newline at end of file
@@ -7,9 +7,57 @@ Maintains audit trail and lineage for all semantic transformations.
 import hashlib
 import json
 import unicodedata
-import re
+import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # optional; only used where its bytes provably match (_dumps_strings)
+
+
+def _dumps_sorted(obj: Any) -> bytes:
+    """
+    Canonical JSON bytes behind every content hash and ID.
+    
+    The format is exactly ``json.dumps(obj, sort_keys=True, separators=(",", ":"),
+    ensure_ascii=False)`` encoded as UTF-8, in every environment: floats use
+    Python's repr (``1e+16``) and non-finite floats are written as ``NaN`` /
+    ``Infinity``. orjson is deliberately not used here, because it formats
+    floats and NaN differently and so would change IDs depending on whether
+    it is installed.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_strings(values: List[str]) -> bytes:
+    """_dumps_sorted() of a list of str, via orjson when installed (string escaping is identical)."""
+    if orjson is not None and all(type(v) is str for v in values):
+        try:
+            return orjson.dumps(values)
+        except TypeError:
+            pass  # e.g. lone surrogates; json then raises the same way without orjson
+    return _dumps_sorted(values)
+
+
+# (millisecond tick, formatted timestamp) reused by now_iso()
+_NOW_CACHE: List[Any] = [-1, ""]
+
+
+def now_iso() -> str:
+    """
+    Current UTC time as a naive ISO-8601 string (same format as utcnow().isoformat()).
+    
+    The formatted value is reused for calls within the same millisecond, so
+    tight batches of ops do not allocate a fresh datetime each time.
+    """
+    tick = time.monotonic_ns() // 1_000_000
+    if tick != _NOW_CACHE[0]:
+        _NOW_CACHE[1] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        _NOW_CACHE[0] = tick
+    return _NOW_CACHE[1]
 
 
 def canonical_value(value: Any) -> str:
@@ -23,9 +71,9 @@ def canonical_value(value: Any) -> str:
         Canonical string representation
     """
     if isinstance(value, str):
-        return _normalize(value)
+        return _canonical_str(value)
     elif isinstance(value, (dict, list)):
-        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+        return _dumps_sorted(value).decode("utf-8")
     elif value is None:
         return ""
     else:
@@ -36,9 +84,39 @@ def _normalize(s: str) -> str:
     """Normalize string for consistent hashing (from semmul_cf14.py)."""
     if s is None:
         return ""
-    s = unicodedata.normalize("NFKC", str(s))
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return _canonical_str(str(s))
+
+
+# Intern table of strings known to be canonical (outputs of _normalize_str are
+# fixed points). Maps each to its shared instance so repeated cell values across
+# matrices reference one object; bounded so unique values cannot grow it forever.
+_CANONICAL_MAX = 8192
+_CANONICAL: Dict[str, str] = {}
+
+
+def _canonical_str(s: str) -> str:
+    """Return the interned canonical form, short-circuiting already-canonical strings."""
+    hit = _CANONICAL.get(s)
+    if hit is not None:
+        return hit
+    out = _normalize_str(s)
+    hit = _CANONICAL.get(out)
+    if hit is not None:
+        return hit
+    if len(_CANONICAL) >= _CANONICAL_MAX:
+        _CANONICAL.clear()
+    _CANONICAL[out] = out
+    return out
+
+
+@lru_cache(maxsize=8192)
+def _normalize_str(s: str) -> str:
+    """Memoized NFKC + whitespace collapse; prompts and cell values recur heavily."""
+    # ASCII is already NFKC; otherwise let the quick check skip the full pass
+    if not s.isascii() and not unicodedata.is_normalized("NFKC", s):
+        s = unicodedata.normalize("NFKC", s)
+    # str.split() collapses and strips Unicode whitespace in one C-level pass
+    return " ".join(s.split())
 
 
 def prompt_hash(system: str, user: str, context: Dict[str, Any]) -> str:
@@ -51,17 +129,61 @@ def prompt_hash(system: str, user: str, context: Dict[str, Any]) -> str:
         context: Context dictionary
     
     Returns:
-        SHA256 hash
+        BLAKE2b hash
     """
-    h = hashlib.sha256()
+    h = hashlib.blake2b(digest_size=32)
     h.update(canonical_value(system).encode("utf-8"))
     h.update(b"\n\n")
     h.update(canonical_value(user).encode("utf-8"))
     h.update(b"\n\n")
-    h.update(json.dumps(context, sort_keys=True).encode("utf-8"))
+    _hash_canonical(context, h, compact=True)
     return h.hexdigest()
 
 
+def _hash_canonical(obj: Any, digest: Any, compact: bool = False) -> None:
+    """
+    Feed the bytes of ``json.dumps(obj, sort_keys=True)`` into `digest` incrementally.
+    
+    Walks dicts and lists directly so the full serialized string is never
+    materialized; the resulting digest is identical to hashing the dumped JSON.
+    With ``compact=True`` the stream matches `_dumps_sorted` instead.
+    
+    Args:
+        obj: JSON-compatible value
+        digest: hashlib-style object exposing ``update(bytes)``
+        compact: Use `_dumps_sorted` formatting (no spaces, raw UTF-8)
+    """
+    if compact:
+        item_sep, key_sep, dumps_opts = b",", b":", {"ensure_ascii": False}
+    else:
+        item_sep, key_sep, dumps_opts = b", ", b": ", {}
+    if isinstance(obj, dict):
+        if not all(isinstance(k, str) for k in obj):
+            # Non-string keys are coerced by json; defer to it for exact output
+            if compact:
+                digest.update(_dumps_sorted(obj))
+            else:
+                digest.update(json.dumps(obj, sort_keys=True).encode())
+            return
+        digest.update(b"{")
+        for i, key in enumerate(sorted(obj)):
+            if i:
+                digest.update(item_sep)
+            digest.update(json.dumps(key, **dumps_opts).encode())
+            digest.update(key_sep)
+            _hash_canonical(obj[key], digest, compact)
+        digest.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        digest.update(b"[")
+        for i, item in enumerate(obj):
+            if i:
+                digest.update(item_sep)
+            _hash_canonical(item, digest, compact)
+        digest.update(b"]")
+    else:
+        digest.update(json.dumps(obj, **dumps_opts).encode())
+
+
 def content_hash(data: Any) -> str:
     """
     Generate hash for content (cells, matrices, etc.).
@@ -70,16 +192,40 @@ def content_hash(data: Any) -> str:
         data: Data to hash
     
     Returns:
-        SHA256 hash (16 chars)
+        BLAKE2b hash (16 chars)
     """
     if isinstance(data, list):
         # For cells list, sort by position for determinism
         sorted_data = sorted(data, key=lambda x: (getattr(x, 'row', 0), getattr(x, 'col', 0)))
-        content = json.dumps([canonical_value(getattr(x, 'value', getattr(x, 'content', {}).get('text', str(x)))) for x in sorted_data], sort_keys=True)
-    else:
-        content = canonical_value(data)
+        return values_hash([canonical_value(_cell_text(x)) for x in sorted_data])
     
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    return hashlib.blake2b(canonical_value(data).encode("utf-8"), digest_size=8).hexdigest()
+
+
+_MISSING = object()
+
+
+def _cell_text(x: Any) -> Any:
+    """Value of a cell-like item: .value, else .content['text'], else str(x)."""
+    # Fallbacks are evaluated only when needed; str() of a Cell dataclass
+    # formats every field and used to run for each cell
+    value = getattr(x, "value", _MISSING)
+    if value is not _MISSING:
+        return value
+    content = getattr(x, "content", {})
+    if "text" in content:
+        return content["text"]
+    return str(x)
+
+
+def values_hash(values: List[str]) -> str:
+    """
+    content_hash() of cells whose canonical values, in row-major order, are `values`.
+    
+    Lets builders that already hold canonical values hash them in one pass,
+    skipping the per-cell sort and attribute probing.
+    """
+    return hashlib.blake2b(_dumps_strings(values), digest_size=8).hexdigest()
 
 
 class ProvenanceTracker:
@@ -112,7 +258,7 @@ class ProvenanceTracker:
             "type": operation_type,
             "inputs": inputs,
             "outputs": outputs,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "metadata": metadata or {}
         }
         
@@ -163,15 +309,16 @@ class ProvenanceTracker:
             data: Provenance data
         
         Returns:
-            SHA256 hash
+            BLAKE2b hash
         """
-        sorted_data = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(sorted_data.encode()).hexdigest()
+        h = hashlib.blake2b(digest_size=32)
+        _hash_canonical(data, h)
+        return h.hexdigest()
     
     def _generate_operation_id(self, operation_type: str, inputs: List[str]) -> str:
         """Generate deterministic operation ID."""
-        content = f"{operation_type}:{':'.join(sorted(inputs))}:{datetime.utcnow().isoformat()}"
-        return f"op_{hashlib.sha256(content.encode()).hexdigest()[:12]}"
+        content = f"{operation_type}:{':'.join(sorted(inputs))}:{now_iso()}"
+        return f"op_{hashlib.blake2b(content.encode(), digest_size=6).hexdigest()}"
     
     def export_provenance(self) -> Dict[str, Any]:
         """
@@ -183,10 +330,17 @@ class ProvenanceTracker:
         return {
             "operations": self.operations,
             "lineage": self.lineage,
-            "exported_at": datetime.utcnow().isoformat()
+            "exported_at": now_iso()
         }
 
 
+def _integrity_hash(record: Dict[str, Any], legacy: bool = False) -> str:
+    """16-hex integrity digest of a provenance record (BLAKE2b; SHA-256 prefix if legacy)."""
+    h = hashlib.sha256() if legacy else hashlib.blake2b(digest_size=8)
+    _hash_canonical(record, h)
+    return h.hexdigest()[:16]
+
+
 def create_cell_provenance(operation: str,
                           sources: List[str],
                           metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -204,16 +358,14 @@ def create_cell_provenance(operation: str,
     provenance = {
         "operation": operation,
         "sources": sources,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": now_iso()
     }
     
     if metadata:
         provenance["metadata"] = metadata
     
     # Generate hash for integrity
-    provenance["hash"] = hashlib.sha256(
-        json.dumps(provenance, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    provenance["hash"] = _integrity_hash(provenance)
     
     return provenance
 
@@ -237,11 +389,10 @@ def verify_provenance_integrity(provenance: Dict[str, Any]) -> bool:
     prov_copy = provenance.copy()
     del prov_copy["hash"]
     
-    calculated_hash = hashlib.sha256(
-        json.dumps(prov_copy, sort_keys=True).encode()
-    ).hexdigest()[:16]
-    
-    return stored_hash == calculated_hash
+    if stored_hash == _integrity_hash(prov_copy):
+        return True
+    # Records written before the switch to BLAKE2b carry truncated SHA-256
+    return stored_hash == _integrity_hash(prov_copy, legacy=True)
 
 
 def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str, Any]:
@@ -262,7 +413,7 @@ def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str,
     merged = {
         "operation": "merge",
         "sources": merged_sources,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso(),
         "parent_operations": [
             prov1.get("operation"),
             prov2.get("operation")
@@ -280,8 +431,6 @@ def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str,
         merged["metadata"] = metadata
     
     # Generate new hash
-    merged["hash"] = hashlib.sha256(
-        json.dumps(merged, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    merged["hash"] = _integrity_hash(merged)
     
     return merged
\ No newline at end of file
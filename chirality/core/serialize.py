@@ -10,6 +10,53 @@ from pathlib import Path
 
 from .types import Cell, Matrix, MatrixType, Modality
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # optional; falls back to stdlib json
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text, using orjson when available.
+    
+    Shared by the OpenAI response parsers, matrix loading and the resolver
+    cache. Both backends raise a
+    json.JSONDecodeError (orjson's error subclasses it) on bad input.
+    
+    Args:
+        data: JSON text
+    
+    Returns:
+        Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, using orjson when available.
+    
+    orjson only pretty-prints with two spaces, so other indents (and values
+    orjson rejects, e.g. non-string keys) go through stdlib json. Either
+    backend parses back to the same value.
+    
+    Args:
+        obj: JSON-compatible value
+        indent: JSON indentation level (None for compact)
+    
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
 
 def matrix_to_json(matrix: Matrix, indent: Optional[int] = 2) -> str:
     """
@@ -22,20 +69,20 @@ def matrix_to_json(matrix: Matrix, indent: Optional[int] = 2) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(matrix.to_dict(), indent=indent, ensure_ascii=False)
+    return dumps_json(matrix.to_dict(), indent=indent).decode("utf-8")
 
 
-def matrix_from_json(json_str: str) -> Matrix:
+def matrix_from_json(json_str: Union[str, bytes]) -> Matrix:
     """
     Deserialize matrix from JSON string.
     
     Args:
-        json_str: JSON string
+        json_str: JSON string (or UTF-8 bytes)
     
     Returns:
         Matrix instance
     """
-    data = json.loads(json_str)
+    data = loads_json(json_str)
     return Matrix.from_dict(data)
 
 
@@ -50,8 +97,16 @@ def save_matrix(matrix: Matrix, filepath: Union[str, Path]) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(matrix_to_json(matrix))
+    if orjson is None:
+        # Stream through the buffered writer rather than building the whole
+        # document as one string and then an encoded copy of it
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(matrix.to_dict(), f, indent=2, ensure_ascii=False)
+        return
+    
+    # Bytes straight from the encoder; no str round-trip
+    with open(filepath, "wb") as f:
+        f.write(dumps_json(matrix.to_dict()))
 
 
 def load_matrix(filepath: Union[str, Path]) -> Matrix:
@@ -66,7 +121,8 @@ def load_matrix(filepath: Union[str, Path]) -> Matrix:
     """
     filepath = Path(filepath)
     
-    with open(filepath, "r", encoding="utf-8") as f:
+    # Raw bytes skip a decode step; both JSON backends accept UTF-8 bytes
+    with open(filepath, "rb") as f:
         return matrix_from_json(f.read())
 
 
@@ -119,7 +175,7 @@ def format_matrix_summary(matrix: Matrix) -> str:
         Formatted summary string
     """
     lines = [
-        f"Matrix {matrix.type.value} ({matrix.id})",
+        f"Matrix {matrix.name} ({matrix.id})",
         f"Dimensions: {matrix.dimensions[0]}×{matrix.dimensions[1]}",
         f"Cells: {len(matrix.cells)}"
     ]
@@ -132,7 +188,7 @@ def format_matrix_summary(matrix: Matrix) -> str:
         lines.append("\nSample cells:")
         table = cells_to_table(matrix.cells[:9], max_rows=3, max_cols=3)
         for row in table:
-            lines.append("  " + " | ".join(f"{c[:20]:20}" for c in row))
+            lines.append("  " + " | ".join([f"{c[:20]:20}" for c in row]))
     
     return "\n".join(lines)
 
@@ -186,7 +242,6 @@ def normalize_text(text: str) -> str:
         Normalized text
     """
     import unicodedata
-    import re
     
     if not text:
         return ""
@@ -195,7 +250,7 @@ def normalize_text(text: str) -> str:
     text = unicodedata.normalize("NFKC", str(text))
     
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
     
     return text
 
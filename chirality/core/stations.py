@@ -7,13 +7,12 @@ S3: Objective synthesis (J, F, D outputs)
 """
 
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
 
 from .types import Matrix, MatrixType, Cell, Station, StationType
 from .ids import generate_matrix_id, generate_cell_id
 from .ops import Resolver, EchoResolver, op_multiply, op_interpret, op_elementwise, op_add
 from .validate import validate_matrix, validate_matrix_dimensions
-from .provenance import create_cell_provenance, ProvenanceTracker
+from .provenance import create_cell_provenance, ProvenanceTracker, now_iso
 
 
 class StationRunner:
@@ -103,7 +102,7 @@ class S1Runner(StationRunner):
             "s1_load",
             [],
             [matrix_a.id, matrix_b.id],
-            {"station": "S1", "timestamp": datetime.utcnow().isoformat()}
+            {"station": "S1", "timestamp": now_iso()}
         )
         
         return {"A": matrix_a, "B": matrix_b}
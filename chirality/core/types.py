@@ -4,12 +4,17 @@ Core types for Chirality Framework CF14 protocol.
 Defines the fundamental data structures: Cell, Matrix, Tensor, Station, Operation.
 """
 
-from typing import Any, Dict, List, Optional, Literal
+import sys
+from typing import Any, Dict, List, Optional, Literal, Sequence, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
 
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class Modality(str, Enum):
     """CF14 modalities for semantic content."""
     AXIOM = "axiom"
@@ -38,7 +43,7 @@ class StationType(str, Enum):
     S3 = "S3"  # Objective synthesis
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Cell:
     """
     Fundamental semantic unit in CF14.
@@ -101,7 +106,7 @@ class Cell:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Matrix:
     """
     2D semantic matrix containing cells.
@@ -133,8 +138,48 @@ class Matrix:
         """Legacy property for compatibility."""
         return self.shape
     
+    @classmethod
+    def from_arrays(cls, id: str, name: str, station: str, shape: tuple[int, int],
+                    ids: Sequence[str], rows: Sequence[int], cols: Sequence[int], values: Sequence[str],
+                    hash: str, metadata: Optional[Dict[str, Any]] = None) -> "Matrix":
+        """
+        Create matrix from parallel cell arrays (batch factory).
+        
+        Cells are constructed positionally in one pass, avoiding per-cell
+        keyword unpacking.
+        """
+        return cls(
+            id=id,
+            name=name,
+            station=station,
+            shape=shape,
+            cells=list(map(Cell, ids, rows, cols, values)),
+            hash=hash,
+            metadata=metadata if metadata is not None else {}
+        )
+    
+    def to_arrays(self) -> Tuple[List[str], List[int], List[int], List[str]]:
+        """
+        Cells as parallel (ids, rows, cols, values) lists; inverse of from_arrays().
+        
+        Column-wise access lets hashing, lookups and serialization loop over
+        plain lists instead of touching each Cell's attributes repeatedly.
+        """
+        cells = self.cells
+        return (
+            [c.id for c in cells],
+            [c.row for c in cells],
+            [c.col for c in cells],
+            [c.value for c in cells],
+        )
+    
     def get_cell(self, row: int, col: int) -> Optional[Cell]:
-        """Get cell at specific position."""
+        """
+        Get cell at specific position.
+        
+        A direct scan, so it is always current even when `cells` is mutated in
+        place; bulk readers should use to_arrays() instead of calling this per cell.
+        """
         for cell in self.cells:
             if cell.row == row and cell.col == col:
                 return cell
@@ -175,7 +220,7 @@ class Matrix:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Tensor:
     """
     3D semantic tensor (stack of matrices).
@@ -198,7 +243,7 @@ class Tensor:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Operation:
     """
     Semantic operation record.
@@ -249,7 +294,7 @@ class Operation:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Station:
     """
     Processing station in CF14 pipeline.
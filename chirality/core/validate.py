@@ -8,6 +8,10 @@ from typing import List, Dict, Any, Optional
 from .types import Cell, Matrix, MatrixType, Modality
 
 
+# Plain-string view of MatrixType for membership checks without Enum construction
+_MATRIX_TYPE_VALUES = frozenset(t.value for t in MatrixType)
+
+
 class CF14ValidationError(ValueError):
     """Raised when CF14 validation rules are violated."""
     pass
@@ -107,8 +111,8 @@ def validate_matrix(matrix: Matrix) -> List[str]:
     if not matrix.id:
         errors.append("Matrix missing ID")
     
-    if matrix.type not in MatrixType:
-        errors.append(f"Invalid matrix type: {matrix.type}")
+    if matrix.name not in _MATRIX_TYPE_VALUES:
+        errors.append(f"Invalid matrix type: {matrix.name}")
     
     # Validate dimensions
     rows, cols = matrix.dimensions
@@ -0,0 +1,76 @@
+"""Tests for the resolver caches."""
+
+from chirality.core.types import Matrix
+from chirality.core.cache import ResolveCache, SemanticCache, resolve_key
+
+
+def create_matrix(name: str, hash_val: str = "h"):
+    """Create a minimal test matrix."""
+    return Matrix(
+        id=name,
+        name=name,
+        station="test",
+        shape=(1, 1),
+        cells=[],
+        hash=hash_val,
+        metadata={}
+    )
+
+
+def test_resolve_key_deterministic():
+    """Test that keys are stable and sensitive to inputs."""
+    A = create_matrix("A")
+    key = resolve_key("*", [A], "sys", "usr", {"thread": "t"}, model="m")
+    assert key == resolve_key("*", [A], "sys", "usr", {"thread": "t"}, model="m")
+    assert key != resolve_key("+", [A], "sys", "usr", {"thread": "t"}, model="m")
+    assert key != resolve_key("*", [create_matrix("A", "other")], "sys", "usr", {"thread": "t"}, model="m")
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test that stored grids are returned on lookup."""
+    cache = ResolveCache(tmp_path)
+    assert cache.get("missing") is None
+
+    cache.put("k", [["a", "b"], ["c", "d"]])
+    assert cache.get("k") == [["a", "b"], ["c", "d"]]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_cache_ignores_corrupt_entries(tmp_path):
+    """Test that unreadable entries count as misses."""
+    (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+    assert ResolveCache(tmp_path).get("bad") is None
+
+
+def test_semantic_cache_near_match():
+    """Test that near-identical embeddings hit and distant ones miss."""
+    vectors = {"a": [1.0, 0.0], "a2": [0.99, 0.05], "b": [0.0, 1.0]}
+    cache = SemanticCache(vectors.__getitem__, threshold=0.95)
+
+    grid, probe = cache.lookup("*", "a")
+    assert grid is None
+    cache.add(probe, [["x"]])
+
+    assert cache.lookup("*", "a2")[0] == [["x"]]
+    assert cache.lookup("*", "b")[0] is None
+    assert cache.lookup("+", "a2")[0] is None
+
+
+def test_semantic_cache_embed_failure_is_miss():
+    """Test that an embedding error degrades to a miss with no probe."""
+    def boom(text):
+        raise RuntimeError("offline")
+    assert SemanticCache(boom).lookup("*", "a") == (None, None)
+
+
+def test_semantic_cache_hits_are_copies():
+    """Test that mutating a stored or returned grid does not change the cache."""
+    cache = SemanticCache({"a": [1.0, 0.0]}.__getitem__)
+    stored = [["x", "y"]]
+    cache.add(cache.lookup("*", "a")[1], stored)
+    stored[0][0] = "changed"
+
+    hit = cache.lookup("*", "a")[0]
+    hit[0][1] = "changed"
+    hit.append(["extra"])
+    assert cache.lookup("*", "a")[0] == [["x", "y"]]
@@ -47,4 +47,12 @@ def test_id_prefixes():
     assert thread_id("demo").startswith("cf14:")
     assert matrix_id("cf14:demo", "A", 1).startswith("cf14:demo:A:")
     assert cell_id("cf14:demo:A:v1", 0, 0, "test").startswith("cf14:demo:A:v1:")
-    assert operation_id("*", ["A", "B"], "hash1", "hash2").startswith("op:")
\ No newline at end of file
+    assert operation_id("*", ["A", "B"], "hash1", "hash2").startswith("op:")
+
+def test_cell_ids_match_cell_id():
+    """Test that batch cell_ids agrees with cell_id."""
+    from chirality.core.ids import cell_ids
+    
+    rows, cols, values = [0, 0, 1], [0, 1, 0], ["a", "b", "c"]
+    expected = [cell_id("cf14:demo:C:v1", r, c, v) for r, c, v in zip(rows, cols, values)]
+    assert cell_ids("cf14:demo:C:v1", rows, cols, values) == expected
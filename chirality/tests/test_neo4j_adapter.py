@@ -0,0 +1,144 @@
+"""Tests for the legacy Neo4jAdapter write path (no server required)."""
+
+from chirality.adapters import neo4j_adapter
+from chirality.adapters.neo4j_adapter import Neo4jAdapter
+from chirality.core.types import Cell, Matrix
+
+
+class _Result:
+    def consume(self):
+        return None
+
+
+class _Tx:
+    def __init__(self):
+        self.calls = []
+
+    def run(self, query, **params):
+        self.calls.append((query, params))
+        return _Result()
+
+
+class _Session(_Tx):
+    def __init__(self):
+        super().__init__()
+        self.write_calls = 0
+        self.tx = _Tx()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, fn, *args):
+        self.write_calls += 1
+        return fn(self.tx, *args)
+
+
+class _Driver:
+    def __init__(self):
+        self.sessions = []
+
+    def session(self):
+        s = _Session()
+        self.sessions.append(s)
+        return s
+
+
+def _adapter():
+    adapter = Neo4jAdapter.__new__(Neo4jAdapter)
+    adapter.driver = _Driver()
+    adapter._matrix_cache = {}
+    return adapter
+
+
+def _matrix(rows, cols):
+    cells = [Cell(id=f"c{i}_{j}", row=i, col=j, value=f"v{i}{j}")
+             for i in range(rows) for j in range(cols)]
+    return Matrix(id="M1", name="A", station="Problem Statement",
+                  shape=(rows, cols), cells=cells, hash="h")
+
+
+def test_save_matrix_single_transaction_unwinds_cells(monkeypatch):
+    """Test that cells are batched into UNWIND queries inside one transaction."""
+    monkeypatch.setattr(neo4j_adapter, "CELL_BATCH_SIZE", 4)
+    adapter = _adapter()
+    adapter.save_matrix(_matrix(3, 3), thread_id="t1")
+
+    session, = adapter.driver.sessions
+    assert session.write_calls == 1
+    assert session.calls == []
+    cell_calls = [p for q, p in session.tx.calls if "UNWIND $cells" in q]
+    assert [len(p["cells"]) for p in cell_calls] == [4, 4, 1]
+    sent = [c["id"] for p in cell_calls for c in p["cells"]]
+    assert sent == [f"c{i}_{j}" for i in range(3) for j in range(3)]
+    # Thread, matrix, link and three cell batches
+    assert len(session.tx.calls) == 6
+
+
+def test_create_lineage_one_query():
+    """Test that all lineage sources are written with a single query."""
+    adapter = _adapter()
+    adapter.create_lineage(["A", "B", "C"], "D", "multiply")
+
+    session, = adapter.driver.sessions
+    assert len(session.calls) == 1
+    assert session.calls[0][1]["source_ids"] == ["A", "B", "C"]
+
+
+def test_load_matrix_cached_until_saved():
+    """Test that repeated loads hit the cache and save_matrix invalidates it."""
+    adapter = _adapter()
+    fetched = []
+
+    def fetch(matrix_id):
+        fetched.append(matrix_id)
+        return _matrix(1, 1) if matrix_id == "M1" else None
+
+    adapter._fetch_matrix = fetch
+    first = adapter.load_matrix("M1")
+    assert adapter.load_matrix("M1").cells == first.cells
+    assert adapter.load_matrix("missing") is None
+    assert adapter.load_matrix("missing") is None
+    assert fetched == ["M1", "missing", "missing"]
+
+    adapter.save_matrix(first)
+    adapter.load_matrix("M1")
+    adapter.clear_cache()
+    adapter.load_matrix("M1")
+    assert fetched.count("M1") == 3
+
+
+def test_load_matrix_returns_independent_copies():
+    """Test that mutating a loaded matrix does not change later loads."""
+    adapter = _adapter()
+    adapter._fetch_matrix = lambda matrix_id: _matrix(1, 2)
+
+    first = adapter.load_matrix("M1")
+    first.cells[0].value = "edited"
+    first.metadata["k"] = "v"
+    second = adapter.load_matrix("M1")
+    second.cells.pop()
+
+    third = adapter.load_matrix("M1")
+    assert third.cells[0].value == "v00"
+    assert len(third.cells) == 2 and third.metadata == {}
+
+
+def test_load_matrix_uncached_by_default(monkeypatch):
+    """Test that adapters only cache loads when cache_matrices is enabled."""
+    class _GraphDatabase:
+        @staticmethod
+        def driver(uri, auth):
+            return _Driver()
+
+    monkeypatch.setattr(neo4j_adapter, "GraphDatabase", _GraphDatabase)
+    adapter = Neo4jAdapter("bolt://x", "u", "p")
+    fetched = []
+    adapter._fetch_matrix = lambda matrix_id: fetched.append(matrix_id) or _matrix(1, 1)
+
+    adapter.load_matrix("M1")
+    adapter.load_matrix("M1")
+    adapter.clear_cache()
+    assert fetched == ["M1", "M1"]
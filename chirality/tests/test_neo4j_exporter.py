@@ -0,0 +1,368 @@
+"""Tests for the CF14 Neo4j exporter write path (no database required)."""
+
+import json
+
+import pytest
+from chirality.exporters import neo4j_cf14_exporter
+from chirality.exporters.neo4j_cf14_exporter import CF14Neo4jExporter, CF14Neo4jHttpExporter
+
+
+class FakeSession:
+    """Records every query run against it."""
+
+    def __init__(self):
+        self.runs = []
+        self.transactions = 0
+        self.consumed = 0
+
+    def run(self, query, **params):
+        self.runs.append((query, params))
+        return self
+
+    def consume(self):
+        self.consumed += 1
+
+    def close(self):
+        self.closed = True
+
+    def execute_write(self, work, *args):
+        self.transactions += 1
+        return work(self, *args)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeDriver:
+    """Hands out a single shared FakeSession."""
+
+    def __init__(self):
+        self.session_obj = FakeSession()
+        self.sessions_opened = 0
+
+    def session(self, **kwargs):
+        self.sessions_opened += 1
+        return self.session_obj
+
+    def close(self):
+        pass
+
+
+def make_exporter():
+    """Create an exporter wired to a fake driver."""
+    exporter = CF14Neo4jExporter.__new__(CF14Neo4jExporter)
+    exporter.driver = FakeDriver()
+    exporter.database = "neo4j"
+    exporter._session = None
+    exporter._driver_kwargs = {}
+    return exporter
+
+
+def test_export_batches_cells_with_unwind():
+    """Test that nodes and links are written as one UNWIND query each per matrix."""
+    exporter = make_exporter()
+    exporter.export({"A": [[1, 0], ["x", 2.5]]}, thread_id="t")
+
+    runs = exporter.driver.session_obj.runs
+    assert len(runs) == 3  # matrix upsert + node pass + link pass
+    node_query, node_params = runs[1]
+    assert "UNWIND $nodes" in node_query
+    assert [(n["type"], n["pos"]) for n in node_params["nodes"]] == [
+        ("row", {"row": 0}), ("col", {"col": 0}), ("row", {"row": 1}), ("col", {"col": 1}),
+    ]
+    link_query, link_params = runs[2]
+    assert "UNWIND $rows" in link_query
+    assert [r["w"] for r in link_params["rows"]] == [1.0, 2.5]
+
+
+def test_export_chunks_large_batches(monkeypatch):
+    """Test that link rows are split into UNWIND_BATCH_SIZE chunks."""
+    monkeypatch.setattr(neo4j_cf14_exporter, "UNWIND_BATCH_SIZE", 2)
+    exporter = make_exporter()
+    exporter.export({"A": [[1, 1, 1], [1, 1, 0]]}, thread_id="t")
+
+    link_runs = [p for q, p in exporter.driver.session_obj.runs if "RELATES_TO" in q]
+    assert [len(p["rows"]) for p in link_runs] == [2, 2, 1]
+
+
+def test_all_zero_matrix_writes_only_matrix_node():
+    """Test that an all-zero or empty matrix costs a single upsert statement."""
+    exporter = make_exporter()
+    exporter.export({"A": [[0, 0], [0.0, "x"]], "B": []}, thread_id="t")
+
+    queries = [q for q, _ in exporter.driver.session_obj.runs]
+    assert queries == [neo4j_cf14_exporter._MERGE_MATRIX] * 2
+
+def test_export_reads_clock_once(monkeypatch):
+    """Test that one timestamp is taken per export and shared by all matrices."""
+    ticks = iter(["2024-01-01T00:00:00", "2024-01-01T00:00:01"])
+    monkeypatch.setattr(neo4j_cf14_exporter, "now_iso", lambda: next(ticks))
+    exporter = make_exporter()
+    exporter.export({"A": [[1]], "B": [[2]]}, thread_id="t")
+
+    stamps = {p["updatedAt"] for q, p in exporter.driver.session_obj.runs if "updatedAt" in p}
+    assert stamps == {"2024-01-01T00:00:00"}
+
+def test_export_uses_single_transaction():
+    """Test that all matrices are written in one write transaction."""
+    exporter = make_exporter()
+    exporter.export({"A": [[1]], "B": [[0, 2]]}, thread_id="t")
+
+    session = exporter.driver.session_obj
+    assert session.transactions == 1
+    assert len(session.runs) == session.consumed == 6
+
+
+def test_schema_created_once_per_database(monkeypatch):
+    """Test that constraint DDL runs only for the first exporter per database."""
+    driver = FakeDriver()
+    monkeypatch.setattr(neo4j_cf14_exporter, "GraphDatabase",
+                        type("FakeGraphDatabase", (), {"driver": staticmethod(lambda uri, auth: driver)}))
+    monkeypatch.setattr(CF14Neo4jExporter, "_schema_ready", set())
+
+    CF14Neo4jExporter(uri="bolt://x", database="db1")
+    CF14Neo4jExporter(uri="bolt://x", database="db1")
+    assert len(driver.session_obj.runs) == 2  # one constraint per label
+
+    CF14Neo4jExporter(uri="bolt://x", database="db2")
+    assert len(driver.session_obj.runs) == 4
+
+
+def test_schema_retried_after_failure(monkeypatch):
+    """Test that a failed schema setup is not recorded as done."""
+    driver = FakeDriver()
+    monkeypatch.setattr(neo4j_cf14_exporter, "GraphDatabase",
+                        type("FakeGraphDatabase", (), {"driver": staticmethod(lambda uri, auth: driver)}))
+    monkeypatch.setattr(CF14Neo4jExporter, "_schema_ready", set())
+
+    real_run, failing = driver.session_obj.run, [True]
+
+    def run(query, **params):
+        if failing[0]:
+            raise ConnectionError("unavailable")
+        return real_run(query, **params)
+
+    monkeypatch.setattr(driver.session_obj, "run", run)
+    CF14Neo4jExporter(uri="bolt://x", database="db1")
+    assert not CF14Neo4jExporter._schema_ready
+
+    failing[0] = False
+    CF14Neo4jExporter(uri="bolt://x", database="db1")
+    assert len(driver.session_obj.runs) == 2
+    assert len(CF14Neo4jExporter._schema_ready) == 1
+
+
+def test_connection_timeout_passed_to_driver(monkeypatch):
+    """Test that connection_timeout reaches the driver only when given."""
+    seen = []
+
+    def fake_driver(uri, auth, **kwargs):
+        seen.append(kwargs)
+        return FakeDriver()
+
+    monkeypatch.setattr(neo4j_cf14_exporter, "GraphDatabase",
+                        type("FakeGraphDatabase", (), {"driver": staticmethod(fake_driver)}))
+    CF14Neo4jExporter(uri="bolt://x", connection_timeout=5.0)
+    CF14Neo4jExporter(uri="bolt://x")
+    assert seen == [{"connection_timeout": 5.0}, {}]
+
+def test_nonzero_cells_generic_and_ndarray():
+    """Test zero/non-numeric skipping, and that ndarrays match nested lists."""
+    from chirality.exporters.neo4j_cf14_exporter import _nonzero_cells
+
+    data = [[0, 1.5, "x"], [None, 0.0, -2]]
+    assert list(_nonzero_cells(data)) == [(0, 1, 1.5), (1, 2, -2.0)]
+
+    np = pytest.importorskip("numpy")
+    arr = np.array([[0, 1.5, 0], [3, 0.0, -2]])
+    assert list(_nonzero_cells(arr)) == list(_nonzero_cells(arr.tolist()))
+
+
+def test_nonzero_cells_sparse_matches_dense():
+    """Test that scipy.sparse inputs yield the same cells as their dense form."""
+    sparse = pytest.importorskip("scipy.sparse")
+    dense = [[0, 1.5, 0], [3, 0.0, -2]]
+    from chirality.exporters.neo4j_cf14_exporter import _nonzero_cells
+
+    coo = sparse.coo_matrix(dense)
+    shuffled = sparse.coo_matrix((coo.data[::-1], (coo.row[::-1], coo.col[::-1])), shape=coo.shape)
+    for matrix in (sparse.csr_matrix(dense), shuffled):
+        assert list(_nonzero_cells(matrix)) == list(_nonzero_cells(dense))
+
+    exporter = make_exporter()
+    exporter.export({"A": sparse.csr_matrix(dense)}, thread_id="t")
+    _, matrix_params = exporter.driver.session_obj.runs[0]
+    assert (matrix_params["rows"], matrix_params["cols"]) == (2, 3)
+
+def test_node_ids_hashed_once_per_row_and_col(monkeypatch):
+    """Test that node ids are derived once per row/column, not per cell."""
+    calls = []
+    real_sha = neo4j_cf14_exporter._sha.__wrapped__
+    monkeypatch.setattr(neo4j_cf14_exporter, "_sha", lambda s: calls.append(s) or real_sha(s))
+    neo4j_cf14_exporter._node_id.cache_clear()
+
+    exporter = make_exporter()
+    exporter.export({"A": [[1] * 4 for _ in range(3)]}, thread_id="t")
+
+    assert len(calls) == 1 + 3 + 4  # matrix id + rows + cols
+
+
+def test_export_async_one_transaction_per_matrix(monkeypatch):
+    """Test that export_async writes each matrix in its own session."""
+    import asyncio
+
+    sessions = []
+
+    class FakeAsyncSession:
+        def __init__(self):
+            self.runs = []
+            self.consumed = 0
+            sessions.append(self)
+
+        async def run(self, query, **params):
+            self.runs.append((query, params))
+            return self
+
+        async def consume(self):
+            self.consumed += 1
+
+        async def execute_write(self, work, *args):
+            return await work(self, *args)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeAsyncDriver:
+        def session(self, **kwargs):
+            return FakeAsyncSession()
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(neo4j_cf14_exporter, "AsyncGraphDatabase",
+                        type("FakeAsyncGraphDatabase", (), {"driver": staticmethod(lambda uri, auth: FakeAsyncDriver())}))
+    exporter = make_exporter()
+    exporter._uri, exporter._auth = "bolt://x", ("u", "p")
+
+    asyncio.run(exporter.export_async({"A": [[1]], "B": [[2, 3]]}, thread_id="t"))
+
+    assert len(sessions) == 2
+    assert all(len(s.runs) == s.consumed == 3 for s in sessions)
+
+
+def test_export_parallel_session_per_matrix():
+    """Test that export_parallel writes each matrix through its own session."""
+    import threading
+
+    sessions = []
+    lock = threading.Lock()
+
+    class PerCallDriver:
+        def session(self, **kwargs):
+            with lock:
+                sessions.append(FakeSession())
+                return sessions[-1]
+
+    exporter = make_exporter()
+    exporter.driver = PerCallDriver()
+    exporter.export_parallel({"A": [[1]], "B": [[2, 3]], "C": [[0]]}, thread_id="t")
+
+    assert len(sessions) == 3
+    assert all(s.transactions == 1 for s in sessions)
+    assert sorted(len(s.runs) for s in sessions) == [1, 3, 3]
+
+def test_sha_memoized():
+    """Test that repeated id derivations are served from the cache."""
+    sha = neo4j_cf14_exporter._sha
+    sha.cache_clear()
+    first = sha("t|A|row|0")
+    assert sha("t|A|row|0") == first
+    assert sha.cache_info().hits == 1
+
+
+def test_node_id_matches_string_key():
+    """Test that tuple-keyed node ids equal hashing the formatted key."""
+    from chirality.exporters.neo4j_cf14_exporter import _node_id, _sha
+    assert _node_id("t", "A", "row", 3) == _sha("t|A|row|3")
+
+
+def test_query_text_shared_across_matrices():
+    """Test that every matrix reuses the same module-level query strings."""
+    exporter = make_exporter()
+    exporter.export({"A": [[1]], "B": [[2]]}, thread_id="t")
+
+    queries = [q for q, _ in exporter.driver.session_obj.runs]
+    assert queries[0] is queries[3] is neo4j_cf14_exporter._MERGE_MATRIX
+    assert queries[1] is queries[4] is neo4j_cf14_exporter._MERGE_NODES
+    assert queries[2] is queries[5] is neo4j_cf14_exporter._LINK_CELLS
+
+def test_session_reused_across_exports():
+    """Test that repeated exports share one session, closed by close()."""
+    exporter = make_exporter()
+    exporter.export({"A": [[1]]}, thread_id="t")
+    exporter.export({"A": [[2]]}, thread_id="t")
+
+    assert exporter.driver.sessions_opened == 1
+    exporter.close()
+    assert exporter.driver.session_obj.closed
+    assert exporter._session is None
+
+
+class FakeHttpConnection:
+    """Records POSTs and answers with queued (status, body) responses."""
+
+    def __init__(self, responses=None):
+        self.requests = []
+        self.responses = list(responses or [])
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, json.loads(body)))
+
+    def getresponse(self):
+        status, body = self.responses.pop(0) if self.responses else (200, b'{"results": [], "errors": []}')
+        return type("FakeResponse", (), {"status": status, "read": lambda self: body})()
+
+    def close(self):
+        pass
+
+
+def make_http_exporter(monkeypatch, conn):
+    """Create an HTTP exporter wired to a fake connection."""
+    import http.client
+    monkeypatch.setattr(http.client, "HTTPConnection", lambda *a, **k: conn)
+    monkeypatch.setattr(CF14Neo4jExporter, "_schema_ready", set())
+    return CF14Neo4jHttpExporter(uri="http://x:7474", user="u", password="p", database="db1")
+
+
+def test_http_export_posts_all_statements_once(monkeypatch):
+    """Test that an HTTP export sends every matrix in a single commit request."""
+    conn = FakeHttpConnection()
+    exporter = make_http_exporter(monkeypatch, conn)
+    del conn.requests[:]  # schema DDL
+
+    exporter.export({"A": [[1]], "B": [[0, 2]]}, thread_id="t")
+
+    assert len(conn.requests) == 1
+    method, path, payload = conn.requests[0]
+    assert (method, path) == ("POST", "/db/db1/tx/commit")
+    assert len(payload["statements"]) == 6
+    assert payload["statements"][2]["parameters"]["rows"][0]["w"] == 1.0
+
+
+def test_http_export_raises_on_cypher_error(monkeypatch):
+    """Test that errors reported in the response body are raised."""
+    conn = FakeHttpConnection()
+    exporter = make_http_exporter(monkeypatch, conn)
+    conn.responses.append((200, b'{"results": [], "errors": [{"code": "Neo.X", "message": "boom"}]}'))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        exporter.export({"A": [[1]]}, thread_id="t")
@@ -96,4 +96,548 @@ def test_echo_resolver_output_format():
     assert isinstance(result, list)
     assert len(result) == 2  # rows
     assert len(result[0]) == 2  # cols
-    assert all(isinstance(cell, str) for row in result for cell in row)
\ No newline at end of file
+    assert all(isinstance(cell, str) for row in result for cell in row)
+
+def test_echo_resolver_cross_indices():
+    """Test that EchoResolver cross-product maps expanded indices back to A and B."""
+    A = create_test_matrix("A", (2, 3))
+    B = create_test_matrix("B", (3, 2))
+    resolver = EchoResolver()
+    
+    result = resolver.resolve("×", [A, B], "system", "user", {})
+    
+    assert len(result) == 6 and len(result[0]) == 6
+    assert result[0][0] == "×:A[0,0]⨂B[0,0]"
+    assert result[4][3] == "×:A[1,1]⨂B[1,1]"
+
+
+def test_build_output_matrix_cells_and_hash():
+    """Test that batch-built output cells are row-major and hash like a cell list."""
+    from chirality.core.ops import _build_output_matrix
+    from chirality.core.provenance import content_hash
+    
+    M = _build_output_matrix("t", "C", "test", [["a ", "b"], ["c", " d"]])
+    
+    assert [(c.row, c.col, c.value) for c in M.cells] == [(0, 0, "a"), (0, 1, "b"), (1, 0, "c"), (1, 1, "d")]
+    assert M.get_cell(1, 1).id.startswith("t:C:v1:1:1:")
+    assert M.hash == content_hash(M.cells)
+
+
+def test_openai_grid_from_response():
+    """Test parsing and validation of an emit_matrix tool call."""
+    from types import SimpleNamespace
+    from chirality.core.ops import OpenAIResolver
+    
+    def response(name, arguments):
+        call = SimpleNamespace(function=SimpleNamespace(name=name, arguments=arguments))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(tool_calls=[call]))])
+    
+    grid = OpenAIResolver._grid_from_response(
+        response("emit_matrix", '{"shape": [1, 2], "cells": [["  a  b ", "c"]]}'))
+    assert grid == [["a b", "c"]]
+    
+    with pytest.raises(CF14ValidationError):
+        OpenAIResolver._grid_from_response(response("emit_matrix", '{"shape": [2, 2], "cells": [["a", "b"]]}'))
+    with pytest.raises(CF14ValidationError):
+        OpenAIResolver._grid_from_response(response("other_tool", "{}"))
+
+
+class _FakeCellResolver:
+    """Deterministic stand-in for CellResolver that counts calls."""
+    model = "fake"
+    
+    def __init__(self):
+        self.call_log = []  # list.append is atomic; calls may come from worker threads
+    
+    @property
+    def calls(self):
+        return len(self.call_log)
+    
+    def multiply_terms(self, term_a, term_b, station, row_label="", col_label=""):
+        self.call_log.append("multiply")
+        return {"text": f"{term_a}*{term_b}"}
+    
+    def add_terms(self, products, station, row_label="", col_label=""):
+        self.call_log.append("add")
+        return {"text": " + ".join(products)}
+    
+    def interpret_term(self, summed_text, station, row_label="", col_label=""):
+        self.call_log.append("interpret")
+        return {"text": summed_text}
+
+
+class _FakeBatchCellResolver(_FakeCellResolver):
+    """Fake resolver exposing the batched entry points."""
+    
+    def multiply_batch(self, pairs, station):
+        self.call_log.append("multiply_batch")
+        return [{"text": f"{a}*{b}"} for a, b, _row, _col in pairs]
+    
+    def add_batch(self, groups, station):
+        self.call_log.append("add_batch")
+        return [{"text": " + ".join(products)} for products, _row, _col in groups]
+
+
+def test_multiply_cell_by_cell_batched_matches_per_pair():
+    """Test that batched cell multiplication gives the same matrix in two calls."""
+    from chirality.core.ops import _op_multiply_cell_by_cell
+    
+    A = create_test_matrix("A", (2, 3))
+    B = create_test_matrix("B", (3, 2))
+    single, batched = _FakeCellResolver(), _FakeBatchCellResolver()
+    
+    C1, _ = _op_multiply_cell_by_cell("t", A, B, single)
+    C2, _ = _op_multiply_cell_by_cell("t", A, B, batched)
+    
+    assert [c.value for c in C1.cells] == [c.value for c in C2.cells]
+    assert C1.get_cell(0, 1).value == "test_0_0*test_0_1 + test_0_1*test_1_1 + test_0_2*test_2_1"
+    assert single.calls == 2 * 2 * 3 + 2 * 2
+    assert batched.calls == 2
+
+
+def test_elementwise_cell_by_cell_batched_matches_per_cell():
+    """Test that batched element-wise multiplication matches per-cell calls."""
+    from chirality.core.ops import _op_elementwise_cell_by_cell
+    
+    J = create_test_matrix("J", (2, 2))
+    C = create_test_matrix("C", (2, 2))
+    C.cells = [c for c in C.cells if (c.row, c.col) != (1, 0)]  # missing term -> empty cell
+    single, batched = _FakeCellResolver(), _FakeBatchCellResolver()
+    
+    F1, _ = _op_elementwise_cell_by_cell("t", J, C, single)
+    F2, _ = _op_elementwise_cell_by_cell("t", J, C, batched)
+    
+    assert [c.value for c in F1.cells] == [c.value for c in F2.cells]
+    assert F1.get_cell(1, 0).value == ""
+    assert F1.get_cell(0, 1).value == "test_0_1*test_0_1"
+    assert single.calls == 3
+    assert batched.calls == 1
+
+def test_add_and_interpret_cell_by_cell_resolve_all_cells():
+    """Test that add/interpret cell paths match across batched and per-cell resolvers."""
+    from chirality.core.ops import _op_add_cell_by_cell, _op_interpret_cell_by_cell
+    
+    A = create_test_matrix("A", (2, 2))
+    F = create_test_matrix("F", (2, 2))
+    F.cells = [c for c in F.cells if (c.row, c.col) != (0, 0)]
+    single, batched = _FakeCellResolver(), _FakeBatchCellResolver()
+    
+    D1, _ = _op_add_cell_by_cell("t", A, F, single)
+    D2, _ = _op_add_cell_by_cell("t", A, F, batched)
+    assert [c.value for c in D1.cells] == [c.value for c in D2.cells]
+    assert D1.get_cell(0, 0).value == "test_0_0"
+    assert D1.get_cell(1, 1).value == "test_1_1 + test_1_1"
+    assert (single.calls, batched.calls) == (4, 1)
+    
+    J, _ = _op_interpret_cell_by_cell("t", F, single)
+    assert [c.value for c in J.cells] == ["", "test_0_1", "test_1_0", "test_1_1"]
+
+def test_map_cell_calls_preserves_order():
+    """Test that threaded per-pair calls return results in submission order."""
+    import time
+    from chirality.core.ops import _map_cell_calls
+    
+    def slow_echo(value):
+        time.sleep(0.001 * (5 - value))  # later items finish first
+        return {"text": str(value)}
+    
+    results = _map_cell_calls(slow_echo, [{"value": v} for v in range(5)])
+    assert [r["text"] for r in results] == ["0", "1", "2", "3", "4"]
+
+def test_async_ops_match_sync():
+    """Test that concurrently run async ops equal their sync counterparts."""
+    from chirality.core.ops import op_multiply_async, op_interpret_async, run_ops_concurrently
+    
+    A = create_test_matrix("A", (2, 3))
+    B = create_test_matrix("B", (3, 2))
+    resolver = EchoResolver()
+    
+    (C_async, _), (J_async, _) = run_ops_concurrently(
+        op_multiply_async("t", A, B, resolver),
+        op_interpret_async("t", B, resolver),
+    )
+    C_sync, _ = op_multiply("t", A, B, resolver)
+    J_sync, _ = op_interpret("t", B, resolver)
+    
+    assert C_async.hash == C_sync.hash
+    assert J_async.hash == J_sync.hash
+
+
+def test_prompt_multiply_grid_content():
+    """Test that the multiply prompt embeds matrix values in row-major order."""
+    from chirality.core.ops import _prompt_multiply
+    
+    A = create_test_matrix("A", (2, 2))
+    A.cells.reverse()  # cell order must not matter
+    B = create_test_matrix("B", (2, 1))
+    
+    system, user = _prompt_multiply(A, B)
+    
+    assert "shape [2, 1]" in system
+    assert "[['test_0_0', 'test_0_1'], ['test_1_0', 'test_1_1']]" in user
+    assert "[['test_0_0'], ['test_1_0']]" in user
+
+
+def test_matrix_get_cell_tracks_cells():
+    """Test that get_cell stays correct as the cells list is mutated, grows or is replaced."""
+    M = create_test_matrix("M", (2, 2))
+    assert M.get_cell(1, 0).value == "test_1_0"
+    assert M.get_cell(2, 2) is None
+    
+    M.cells[2] = Cell(id="r", row=1, col=0, value="replaced")  # same length, in place
+    assert M.get_cell(1, 0).value == "replaced"
+    
+    M.cells.append(Cell(id="x", row=2, col=2, value="extra"))
+    assert M.get_cell(2, 2).value == "extra"
+    
+    M.cells = [Cell(id="y", row=0, col=0, value="new")]
+    assert M.get_cell(0, 0).value == "new"
+    assert M.get_cell(1, 0) is None
+
+
+def test_matrix_arrays_roundtrip():
+    """Test that to_arrays() and from_arrays() are inverses."""
+    M = create_test_matrix("M", (2, 3))
+    ids, rows, cols, values = M.to_arrays()
+    
+    assert rows == [0, 0, 0, 1, 1, 1]
+    assert values[4] == "test_1_1"
+    
+    R = Matrix.from_arrays(M.id, M.name, M.station, M.shape, ids, rows, cols, values, M.hash)
+    assert R == M
+
+
+def test_save_load_matrix_independent_of_orjson(tmp_path, monkeypatch):
+    """Test that saved matrices load back equal with and without orjson."""
+    import json
+    from chirality.core import serialize
+    
+    M = create_test_matrix("M", (2, 2))
+    M.metadata["note"] = "ü"
+    serialize.save_matrix(M, tmp_path / "fast.json")
+    monkeypatch.setattr(serialize, "orjson", None)
+    serialize.save_matrix(M, tmp_path / "slow.json")
+    
+    assert serialize.load_matrix(tmp_path / "fast.json") == M
+    assert serialize.load_matrix(tmp_path / "slow.json") == M
+    assert json.loads((tmp_path / "fast.json").read_bytes()) == json.loads((tmp_path / "slow.json").read_bytes())
+
+def test_build_output_matrix_rejects_ragged_grid():
+    """Test that a grid with a short row is rejected."""
+    from chirality.core.ops import _build_output_matrix
+    
+    with pytest.raises(CF14ValidationError):
+        _build_output_matrix("t", "C", "test", [["a", "b"], ["c"]])
+
+
+def test_resolvers_share_openai_client(monkeypatch):
+    """Test that resolvers with the same API key reuse one client."""
+    from chirality.core import cell_resolver
+    from chirality.core.ops import OpenAIResolver
+    
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.api_key = api_key
+    
+    monkeypatch.setattr(cell_resolver, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    
+    r1 = OpenAIResolver(api_key="k1", cache=None)
+    r2 = cell_resolver.CellResolver(api_key="k1")
+    r3 = OpenAIResolver(api_key="k2", cache=None)
+    
+    assert r1.client is r2.client
+    assert r1.client is not r3.client
+
+
+def test_cell_results_memoized_across_resolvers(monkeypatch):
+    """Test that an identical cell prompt is sent to the API only once."""
+    from chirality.core import cell_resolver
+    
+    calls = []
+    
+    class FakeCompletions:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            message = type("Message", (), {"content": '{"text": "fused", "terms_used": [], "warnings": []}'})
+            return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+    
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.chat = type("Chat", (), {"completions": FakeCompletions()})()
+    
+    monkeypatch.setattr(cell_resolver, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    
+    first = cell_resolver.CellResolver(api_key="k").multiply_terms("a", "b", "requirements")
+    first["warnings"].append("mutated")
+    second = cell_resolver.CellResolver(api_key="k").multiply_terms("a", "b", "requirements")
+    cell_resolver.CellResolver(api_key="k").multiply_terms("a", "c", "requirements")
+    
+    assert second == {"text": "fused", "terms_used": [], "warnings": []}
+    assert len(calls) == 2
+
+def test_valley_summary_brackets_station():
+    """Test that the cached valley map brackets the current station."""
+    from chirality.core.cell_resolver import _valley_summary
+    
+    assert _valley_summary("requirements") == (
+        "Semantic Valley: Problem Statement → [Requirements] → Objectives → Solution Objectives"
+    )
+    assert _valley_summary("objectives") is _valley_summary("objectives")
+
+def test_batch_results_memoized_and_deduplicated(monkeypatch):
+    """Test that batch calls send only distinct, not-yet-resolved items."""
+    import json
+    from chirality.core import cell_resolver
+    
+    sent = []
+    
+    class FakeCompletions:
+        def create(self, **kwargs):
+            body = kwargs["messages"][1]["content"].split("Items:\n", 1)[1].split("\n\nOutput", 1)[0]
+            items = json.loads(body)["items"]
+            sent.append(items)
+            content = json.dumps({"results": [{"text": f"{it['a']}*{it['b']}"} for it in items]})
+            message = type("Message", (), {"content": content})
+            return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+    
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.chat = type("Chat", (), {"completions": FakeCompletions()})()
+    
+    monkeypatch.setattr(cell_resolver, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    resolver = cell_resolver.CellResolver(api_key="k")
+    
+    first = resolver.multiply_batch([("a", "b", "r", "c"), ("a", "b", "r", "c"), ("x", "y", "r", "c")], "requirements")
+    second = resolver.multiply_batch([("x", "y", "r", "c"), ("p", "q", "r", "c")], "requirements")
+    
+    assert [r["text"] for r in first] == ["a*b", "a*b", "x*y"]
+    assert [r["text"] for r in second] == ["x*y", "p*q"]
+    assert [[it["a"] for it in items] for items in sent] == [["a", "x"], ["p"]]
+
+    # Repeated items get independent results; mutations never reach the cache
+    assert first[0] is not first[1]
+    first[0]["warnings"].append("mutated")
+    second[0]["warnings"].append("mutated")
+    again = resolver.multiply_batch([("a", "b", "r", "c"), ("x", "y", "r", "c")], "requirements")
+    assert [r["warnings"] for r in again] == [[], []]
+
+def test_escape_for_prompt_memoized():
+    """Test that prompt escaping is cached and matches the uncached form."""
+    from chirality.core.cell_resolver import escape_for_prompt, _escape_str
+    
+    _escape_str.cache_clear()
+    assert escape_for_prompt(' say  "ﬁne" ') == 'say \\"fine\\"'
+    escape_for_prompt(' say  "ﬁne" ')
+    assert _escape_str.cache_info().hits == 1
+    assert escape_for_prompt(None) == ""
+
+def test_echo_resolver_unknown_op():
+    """Test that an unsupported op raises ValueError."""
+    with pytest.raises(ValueError):
+        EchoResolver().resolve("?", [], "", "", {})
+
+
+def test_ensure_grid_pads_and_truncates_rows():
+    """Test that grid rows are padded or truncated to the declared width."""
+    from chirality.core.ops import _ensure_grid
+    
+    grid = _ensure_grid({"shape": [2, 2], "cells": [["a"], ["b", "c", "extra"]]})
+    assert grid == [["a", ""], ["b", "c"]]
+
+
+def test_echo_resolver_returns_fresh_lists():
+    """Test that memoized echo grids are not shared mutable state."""
+    A = create_test_matrix("A", (2, 2))
+    first = EchoResolver().resolve("interpret", [A], "", "", {})
+    first[0][0] = "mutated"
+    second = EchoResolver().resolve("interpret", [A], "", "", {})
+    assert second[0][0] == "interp:A[0,0]"
+
+
+def _stub_openai(calls):
+    """OpenAI stand-in: emit_matrix tool calls for matrix requests, JSON for cell requests."""
+    import json
+
+    def respond(message):
+        choice = type("Choice", (), {"message": message})
+        return type("Response", (), {"choices": [choice]})
+
+    class FakeCompletions:
+        def create(self, **kwargs):
+            calls.append(kwargs)
+            if "tools" in kwargs:
+                rows, cols = kwargs["tools"][0]["function"]["parameters"]["properties"]["shape"]["const"]
+                args = json.dumps({"shape": [rows, cols], "cells": [["grid"] * cols for _ in range(rows)]})
+                function = type("Function", (), {"name": "emit_matrix", "arguments": args})
+                call = type("ToolCall", (), {"function": function})
+                return respond(type("Message", (), {"tool_calls": [call], "content": None}))
+            prompt = kwargs["messages"][1]["content"]
+            if "Items:\n" in prompt:
+                body = prompt.split("Items:\n", 1)[1].split("\n\nOutput", 1)[0]
+                items = json.loads(body)["items"]
+                content = json.dumps({"results": [{"text": json.dumps(it, sort_keys=True)} for it in items]})
+            else:
+                content = json.dumps({"text": "cell", "terms_used": [], "warnings": []})
+            return respond(type("Message", (), {"content": content, "tool_calls": None}))
+
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            self.api_key = api_key
+            self.chat = type("Chat", (), {"completions": FakeCompletions()})()
+
+    return FakeOpenAI
+
+
+def test_async_resolver_works_with_sync_ops(monkeypatch):
+    """Test that AsyncOpenAIResolver.resolve() stays synchronous for the sync ops."""
+    import warnings
+    from chirality.core import cell_resolver
+    from chirality.core.ops import AsyncOpenAIResolver, op_cross
+    
+    calls = []
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai(calls))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    resolver = AsyncOpenAIResolver(api_key="k", cache=None)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        W, _ = op_cross("t", create_test_matrix("A", (1, 2)), create_test_matrix("B", (2, 1)), resolver)
+    assert W.shape == (2, 2)
+    assert {c.value for c in W.cells} == {"grid"}
+    assert len(calls) == 1
+
+
+def test_async_ops_match_sync_with_openai_resolver(monkeypatch):
+    """Test that async ops route OpenAI resolvers cell-by-cell, like the sync ops."""
+    from chirality.core import cell_resolver
+    from chirality.core.ops import OpenAIResolver, op_multiply_async, op_add_async, run_ops_concurrently
+    
+    calls = []
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai(calls))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    monkeypatch.setenv("OPENAI_API_KEY", "k")
+    resolver = OpenAIResolver(api_key="k", cache=None)
+    A = create_test_matrix("A", (2, 2))
+    B = create_test_matrix("B", (2, 2), "other")
+    
+    C_sync, _ = op_multiply("t", A, B, resolver)
+    (C_async, _), (D_async, _) = run_ops_concurrently(
+        op_multiply_async("t", A, B, resolver),
+        op_add_async("t", A, B, resolver),
+    )
+    
+    assert C_async.hash == C_sync.hash
+    assert D_async.get_cell(0, 0).value == '{"col": "col_0", "products": ["test_0_0", "other_0_0"], "row": "row_0"}'
+    assert not any("tools" in kwargs for kwargs in calls)
+
+
+def test_aresolve_cache_io_runs_off_event_loop(monkeypatch):
+    """Test that aresolve() does its cache lookup in a worker thread."""
+    import asyncio
+    import threading
+    from chirality.core import cell_resolver
+    from chirality.core.ops import OpenAIResolver
+    
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai([]))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    resolver = OpenAIResolver(api_key="k", cache=None)
+    resolver._async_client = object()
+    threads = []
+    
+    def lookup(*args):
+        threads.append(threading.current_thread())
+        return [["hit"]], (None, None)
+    
+    monkeypatch.setattr(resolver, "_cache_lookup", lookup)
+    B = create_test_matrix("B", (1, 1))
+    grid = asyncio.run(resolver.aresolve("interpret", [B], "", "", {}))
+    
+    assert grid == [["hit"]]
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_batch_requests_are_chunked(monkeypatch):
+    """Test that large batches are split into fixed-size requests, results in order."""
+    import json
+    from chirality.core import cell_resolver
+    
+    calls = []
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai(calls))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "BATCH_MAX_ITEMS", 2)
+    resolver = cell_resolver.CellResolver(api_key="k")
+    
+    pairs = [(f"a{n}", "b", "r", "c") for n in range(5)]
+    results = resolver.multiply_batch(pairs, "requirements")
+    
+    assert [json.loads(r["text"])["a"] for r in results] == [f"a{n}" for n in range(5)]
+    assert [kwargs["max_tokens"] for kwargs in calls] == [400, 400, 200]
+
+
+def test_batch_prompts_share_per_cell_instructions(monkeypatch):
+    """Test that batch prompts reuse the per-cell role, task and terms_used echo."""
+    from chirality.core import cell_resolver
+    
+    calls = []
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai(calls))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    resolver = cell_resolver.CellResolver(api_key="k")
+    
+    resolver.multiply_batch([("alpha", "beta", "r", "c")], "requirements")
+    resolver.add_batch([(["p1", "p2"], "r", "c")], "objectives")
+    multiply_prompt, add_prompt = (kwargs["messages"][1]["content"] for kwargs in calls)
+    
+    assert multiply_prompt.startswith(f"Role: {cell_resolver._MULTIPLY_ROLE} ")
+    assert cell_resolver._MULTIPLY_TASK in multiply_prompt
+    assert '"terms_used": ["alpha", "beta"]' in multiply_prompt
+    assert add_prompt.startswith("Role: expert integrator ")
+    assert cell_resolver._ADD_CONTRACT in add_prompt
+
+
+def test_result_cache_evicts_oldest_and_can_be_bypassed(monkeypatch):
+    """Test oldest-first eviction and that memoize=False resamples every cell."""
+    from chirality.core import cell_resolver
+    
+    calls = []
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai(calls))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE", {})
+    monkeypatch.setattr(cell_resolver, "_RESULT_CACHE_MAX", 2)
+    resolver = cell_resolver.CellResolver(api_key="k")
+    
+    for a in ("a", "b", "c"):
+        resolver.multiply_terms(a, "x", "requirements")
+    assert len(cell_resolver._RESULT_CACHE) == 2
+    resolver.multiply_terms("c", "x", "requirements")
+    resolver.multiply_terms("a", "x", "requirements")
+    assert len(calls) == 4
+    
+    fresh = cell_resolver.CellResolver(api_key="k", memoize=False)
+    cached = dict(cell_resolver._RESULT_CACHE)
+    fresh.multiply_terms("a", "x", "requirements")
+    fresh.multiply_batch([("a", "b", "r", "c"), ("a", "b", "r", "c")], "requirements")
+    fresh.multiply_batch([("a", "b", "r", "c")], "requirements")
+    assert len(calls) == 7
+    assert [len(kwargs["messages"][1]["content"].split('"a": "a"')) - 1 for kwargs in calls[5:]] == [2, 1]
+    assert cell_resolver._RESULT_CACHE == cached
+
+
+def test_openai_resolver_without_cache_disables_cell_memo(monkeypatch, tmp_path):
+    """Test that OpenAIResolver(cache=None) builds non-memoizing cell resolvers."""
+    from chirality.core import cell_resolver
+    from chirality.core.ops import OpenAIResolver, _cell_resolver_for
+    
+    monkeypatch.setattr(cell_resolver, "OpenAI", _stub_openai([]))
+    monkeypatch.setattr(cell_resolver, "_CLIENT_CACHE", {})
+    monkeypatch.setenv("OPENAI_API_KEY", "k")
+    
+    assert _cell_resolver_for(OpenAIResolver(api_key="k", cache=None)).memoize is False
+    assert _cell_resolver_for(OpenAIResolver(api_key="k", cache="exact", cache_dir=str(tmp_path))).memoize is True
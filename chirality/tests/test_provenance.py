@@ -0,0 +1,141 @@
+"""Tests for canonicalization and provenance hashing."""
+
+import hashlib
+import json
+
+from chirality.core.provenance import (
+    canonical_value, prompt_hash, _normalize, _hash_canonical,
+    create_cell_provenance, verify_provenance_integrity,
+)
+
+
+def test_normalize_collapses_whitespace():
+    """Test that whitespace runs collapse to single spaces."""
+    assert _normalize("  a \t b\n\nc  ") == "a b c"
+    assert _normalize(None) == ""
+
+
+def test_normalize_nfkc():
+    """Test that compatibility characters are folded by NFKC."""
+    assert _normalize("ﬁle") == "file"
+    assert _normalize("Ａ１") == "A1"
+
+
+def test_normalize_repeated_calls_stable():
+    """Test that memoized normalization returns identical results."""
+    first = _normalize("  repeated   value ")
+    second = _normalize("  repeated   value ")
+    assert first == second == "repeated value"
+
+
+def test_canonical_value_types():
+    """Test canonical_value across supported input types."""
+    assert canonical_value(" x  y ") == "x y"
+    assert canonical_value(None) == ""
+    assert canonical_value(3) == "3"
+    assert canonical_value({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+def test_prompt_hash_deterministic():
+    """Test that prompt_hash is deterministic and whitespace-insensitive."""
+    h1 = prompt_hash("sys", "user", {"inputs": ["A", "B"]})
+    h2 = prompt_hash("sys ", " user", {"inputs": ["A", "B"]})
+    assert h1 == h2
+    assert h1 != prompt_hash("sys", "other", {"inputs": ["A", "B"]})
+
+
+def test_hash_canonical_matches_json_dumps():
+    """Test that streamed hashing equals hashing the dumped JSON string."""
+    data = {"b": [1, 2.5, None, True], "a": {"z": "ü", "y": []}, "c": ("x",)}
+    streamed = hashlib.sha256()
+    _hash_canonical(data, streamed)
+    expected = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    assert streamed.hexdigest() == expected
+
+
+def test_cell_provenance_integrity():
+    """Test that created provenance verifies and tampering is detected."""
+    prov = create_cell_provenance("multiply", ["a", "b"], {"k": 1})
+    assert verify_provenance_integrity(prov)
+    prov["sources"] = ["c"]
+    assert not verify_provenance_integrity(prov)
+
+
+def test_dumps_sorted_matches_stdlib(monkeypatch):
+    """Test that the orjson and stdlib paths produce identical canonical bytes."""
+    from chirality.core import provenance
+    data = {"b": ["ü", "x y"], "a": {"n": 1, "t": True, "z": None}}
+    fast = provenance._dumps_sorted(data)
+    monkeypatch.setattr(provenance, "orjson", None)
+    assert provenance._dumps_sorted(data) == fast
+
+
+def test_canonical_value_idempotent():
+    """Test that canonicalizing a canonical string returns it unchanged."""
+    once = canonical_value("  ﬁnal\tanswer  ")
+    assert once == "final answer"
+    assert canonical_value(once) is once
+
+
+def test_prompt_hash_independent_of_orjson(monkeypatch):
+    """Test that prompt_hash is identical with and without orjson."""
+    from chirality.core import provenance
+    context = {"station": "ü", "inputs": ["A", "B"], "rag_chunks": {}, "n": 2}
+    with_fast = prompt_hash("sys", "user", context)
+    monkeypatch.setattr(provenance, "orjson", None)
+    assert prompt_hash("sys", "user", context) == with_fast
+
+
+def test_verify_accepts_legacy_sha256_records():
+    """Test that records hashed with truncated SHA-256 still verify."""
+    prov = {"operation": "multiply", "sources": ["a"], "timestamp": "2024-01-01T00:00:00"}
+    legacy = hashlib.sha256(json.dumps(prov, sort_keys=True).encode()).hexdigest()[:16]
+    assert verify_provenance_integrity(dict(prov, hash=legacy))
+    assert not verify_provenance_integrity(dict(prov, hash="0" * 16))
+
+
+def test_canonical_value_interns_equal_results():
+    """Test that inputs with the same canonical form share one string object."""
+    a = canonical_value("shared   axiom value")
+    b = canonical_value(" shared axiom\tvalue ")
+    assert a == b == "shared axiom value"
+    assert a is b
+
+
+def test_content_hash_cell_text_fallbacks():
+    """Test that content_hash reads .value, then .content['text'], then str()."""
+    from types import SimpleNamespace
+    from chirality.core.provenance import content_hash, values_hash
+
+    cells = [
+        SimpleNamespace(row=0, col=1, content={"text": " b "}),
+        SimpleNamespace(row=0, col=0, value="a"),
+    ]
+    assert content_hash(cells) == values_hash(["a", "b"])
+
+
+def test_canonical_forms_independent_of_orjson(monkeypatch):
+    """Test that floats, NaN and non-ASCII canonicalize and hash identically with and without orjson."""
+    from chirality.core import provenance, ids
+    payload = {"a": "é", "b": 1e16, "c": [float("nan"), float("inf"), 0.1, -0.0], "d": "naïve ✓"}
+    values = ["é", "1e16", " ", "\x7f", "\x1f", 'q"\\', "𝔘"]
+
+    def snapshot():
+        return (
+            provenance.canonical_value(payload),
+            provenance.prompt_hash("s", "u", payload),
+            provenance.values_hash(values),
+            ids.content_hash(payload),
+        )
+
+    with_fast = snapshot()
+    assert with_fast[0] == '{"a":"é","b":1e+16,"c":[NaN,Infinity,0.1,-0.0],"d":"naïve ✓"}'
+    monkeypatch.setattr(provenance, "orjson", None)
+    assert snapshot() == with_fast
+
+
+def test_values_hash_string_encoding_matches_stdlib():
+    """Test that the orjson string path equals stdlib json for every BMP character."""
+    from chirality.core import provenance
+    chars = [chr(c) for c in range(0x10000) if not 0xD800 <= c <= 0xDFFF]
+    assert provenance._dumps_strings(chars) == provenance._dumps_sorted(chars)
@@ -77,4 +77,11 @@ def test_cf14_validation_error():
     with pytest.raises(CF14ValidationError) as exc_info:
         raise CF14ValidationError("Test error message")
     
-    assert "Test error message" in str(exc_info.value)
\ No newline at end of file
+    assert "Test error message" in str(exc_info.value)
+
+def test_validate_matrix_reports_unknown_type():
+    """Test that unknown matrix names are reported rather than raised."""
+    from chirality.core.validate import validate_matrix
+    
+    errors = validate_matrix(create_matrix("W", (1, 1)))
+    assert "Invalid matrix type: W" in errors
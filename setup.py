@@ -39,6 +39,9 @@ setup(
         "neo4j": [
             "neo4j>=5.0.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",